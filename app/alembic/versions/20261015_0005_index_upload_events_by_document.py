@@ -0,0 +1,43 @@
+"""index upload events by document id
+
+Revision ID: 20261015_0005
+Revises: 20250215_0004
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0005"
+down_revision = "20250215_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently so large events tables stay writable during the migration.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_upload_document_id",
+            "events",
+            [
+                sa.text("jsonb_extract_path_text(task_context, 'metadata', 'document', 'id')"),
+                sa.text("created_at DESC"),
+            ],
+            postgresql_where=sa.text("(data ->> 'event_type') = 'document_upload'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_events_upload_document_id",
+            table_name="events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,39 @@
+"""index summary events by document id
+
+Revision ID: 20261015_0006
+Revises: 20261015_0005
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261015_0006"
+down_revision = "20261015_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_summary_document_id",
+            "events",
+            [sa.text("(data ->> 'document_id')")],
+            postgresql_where=sa.text("(data ->> 'event_type') = 'document_summary'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_events_summary_document_id",
+            table_name="events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -1,7 +1,8 @@
 import logging
-from typing import Generator
+from typing import Generator, Optional
 
 from fastapi import HTTPException, Request, status
+from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
 
 from app.config.settings import get_settings
@@ -26,6 +27,20 @@ def db_session() -> Generator:
         session.close()
 
 
+class BearerToken(HTTPBearer):
+    """``HTTPBearer`` that yields the raw token string, or None when absent.
+
+    Keeps the OpenAPI bearer security scheme while skipping the credentials
+    model the stock dependency builds on every request.
+    """
+
+    async def __call__(self, request: Request) -> Optional[str]:  # type: ignore[override]
+        authorization = request.headers.get("authorization")
+        if not authorization or authorization[:7].lower() != "bearer ":
+            return None
+        return authorization[7:].strip() or None
+
+
 def require_api_key(request: Request) -> None:
     """Verify that the request carries the expected API key if configured."""
     settings = get_settings()
@@ -7,7 +7,19 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, Query, Response, UploadFile
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select, text
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
@@ -18,6 +30,7 @@ from app.config.celery_config import celery_app
 from app.config.settings import get_settings
 from app.database.event import Event
 from app.database.repository import GenericRepository
+from app.doc_utils.search import iter_semantic_search_docling
 from app.services.vector_store import VectorStore
 from app.services.classification_service import (
     ClassificationResult,
@@ -89,6 +102,12 @@ router = APIRouter()
 HOURLY_RATE = 65
 
 
+class SearchStreamRequest(BaseModel):
+    query: str = Field(min_length=1)
+    filters: Optional[Dict[str, Any]] = None
+    limit: int = Field(default=1000, ge=1, le=10000)
+
+
 class ClassificationExample(BaseModel):
     label: str
     text: str
@@ -112,6 +131,13 @@ class ClassificationResponse(BaseModel):
     reasoning: Optional[str] = None
 
 
+class ClassificationTaskStatus(BaseModel):
+    task_id: str
+    status: str
+    result: Optional[ClassificationResponse] = None
+    error: Optional[str] = None
+
+
 class LabelTreeNode(BaseModel):
     id: Optional[str]
     name: str
@@ -250,6 +276,20 @@ def _stitch_examples_and_text(examples: Optional[Sequence[ClassificationExample]
     return _truncate_text("\n\n".join(rendered_examples))
 
 
+def _classification_inputs(
+    session: Session, document_id: str, payload: ClassificationRequest
+) -> Tuple[str, List[str]]:
+    """Resolve the text and candidate labels for a classification request."""
+    text_source = payload.text_override or _build_document_text(session, document_id)
+    combined_text = _stitch_examples_and_text(payload.examples, text_source)
+
+    label_service = LabelService(session=session)
+    candidate_labels = payload.candidate_labels or label_service.get_candidate_labels()
+    if not candidate_labels:
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="No candidate labels available for classification.")
+    return combined_text, list(candidate_labels)
+
+
 def _serialize_label(label: DocumentLabel) -> LabelResponse:
     return LabelResponse(
         id=str(label.id),
@@ -819,13 +859,7 @@ def classify_document(
     session: Session = Depends(db_session),
 ):
     """Classify a document using a local zero-shot transformer."""
-    text_source = payload.text_override or _build_document_text(session, document_id)
-    combined_text = _stitch_examples_and_text(payload.examples, text_source)
-
-    label_service = LabelService(session=session)
-    candidate_labels = payload.candidate_labels or label_service.get_candidate_labels()
-    if not candidate_labels:
-        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="No candidate labels available for classification.")
+    combined_text, candidate_labels = _classification_inputs(session, document_id, payload)
 
     classifier = get_classification_service()
     result = classifier.classify(
@@ -857,6 +891,48 @@ def classify_document(
     )
 
 
+@router.post(
+    "/documents/{document_id}/classify/async",
+    response_model=ClassificationTaskStatus,
+    status_code=HTTPStatus.ACCEPTED,
+)
+def classify_document_async(
+    document_id: str,
+    payload: ClassificationRequest = Body(default_factory=ClassificationRequest),
+    session: Session = Depends(db_session),
+) -> ClassificationTaskStatus:
+    """Queue a classification on the Celery worker and return its task id.
+
+    Poll ``GET /classifications/{task_id}`` for the result; it is recorded in
+    the classification history exactly like the synchronous endpoint.
+    """
+    combined_text, candidate_labels = _classification_inputs(session, document_id, payload)
+    task_result = celery_app.send_task(
+        "classify_document",
+        args=[document_id, combined_text, candidate_labels],
+    )
+    return ClassificationTaskStatus(task_id=str(task_result.id), status="PENDING")
+
+
+@router.get("/classifications/{task_id}", response_model=ClassificationTaskStatus)
+def get_classification_task(task_id: str) -> ClassificationTaskStatus:
+    """Report the state of a queued classification, with its result once finished."""
+    task_result = celery_app.AsyncResult(task_id)
+    status = task_result.state
+    if status == "SUCCESS":
+        # Other tasks share the result backend; only classify_document returns a dict.
+        if not isinstance(task_result.result, dict):
+            raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Classification task not found.")
+        return ClassificationTaskStatus(
+            task_id=task_id,
+            status=status,
+            result=ClassificationResponse(**task_result.result),
+        )
+    if status == "FAILURE":
+        return ClassificationTaskStatus(task_id=task_id, status=status, error=str(task_result.result))
+    return ClassificationTaskStatus(task_id=task_id, status=status)
+
+
 @router.post("/documents/{document_id}/archive", response_model=DocumentLifecycleResponse)
 def archive_document_endpoint(
     document_id: str,
@@ -877,6 +953,7 @@ def archive_document_endpoint(
 @router.delete("/documents/{document_id}", response_model=DocumentLifecycleResponse)
 def delete_document_endpoint(
     document_id: str,
+    background_tasks: BackgroundTasks,
     reason: Optional[str] = Query(default=None),
     purge_vectors: bool = Query(default=True),
     session: Session = Depends(db_session),
@@ -887,6 +964,7 @@ def delete_document_endpoint(
             document_id,
             reason=reason,
             purge_vectors=purge_vectors,
+            background_tasks=background_tasks,
         )
     except ValueError as exc:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(exc)) from exc
@@ -1214,6 +1292,21 @@ def list_search_history(
     return history
 
 
+@router.post("/search/stream")
+async def stream_search_results(request: SearchStreamRequest) -> StreamingResponse:
+    """Stream semantic search results as newline-delimited JSON for large limits."""
+
+    async def ndjson_rows():
+        async for record in iter_semantic_search_docling(
+            query=request.query,
+            limit=request.limit,
+            metadata_filter=request.filters,
+        ):
+            yield json.dumps(record, default=str) + "\n"
+
+    return StreamingResponse(ndjson_rows(), media_type="application/x-ndjson")
+
+
 @router.get("/{event_id}")
 def get_event(
     event_id: UUID,
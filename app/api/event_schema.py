@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict, Field, model_validator
-from typing import List, Optional, Union, Dict, Any, Literal
+from typing import Annotated, List, Optional, Union, Dict, Any, Literal
 
 """
 Event Schema Module
@@ -68,13 +68,17 @@ class QAQueryEvent(StrictEvent):
     top_k: Optional[int] = Field(default=None, ge=1, le=50)
     filters: Optional[Dict[str, Any]] = None
 
-# Union of all event types for the single endpoint
-EventSchema = Union[
-    DocumentUploadEvent,
-    DocumentClassificationEvent,
-    InformationExtractionEvent,
-    SearchQueryEvent,
-    DocumentRoutingEvent,
-    DocumentSummaryEvent,
-    QAQueryEvent,
+# Union of all event types for the single endpoint. Tagged on event_type so
+# validation goes straight to the matching model instead of trying each member.
+EventSchema = Annotated[
+    Union[
+        DocumentUploadEvent,
+        DocumentClassificationEvent,
+        InformationExtractionEvent,
+        SearchQueryEvent,
+        DocumentRoutingEvent,
+        DocumentSummaryEvent,
+        QAQueryEvent,
+    ],
+    Field(discriminator="event_type"),
 ]
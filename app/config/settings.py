@@ -45,6 +45,14 @@ class Settings(BaseSettings):
     chunk_max_tokens: int = Field(default=800, ge=128, le=4000, alias="DOCULENS_CHUNK_MAX_TOKENS")
     embedding_batch_size: int = Field(default=64, ge=1, le=256, alias="DOCULENS_EMBEDDING_BATCH_SIZE")
     embedding_cache_size: int = Field(default=1024, ge=0, le=10000, alias="DOCULENS_EMBEDDING_CACHE_SIZE")
+    search_cache_size: int = Field(default=512, ge=0, le=10000, alias="DOCULENS_SEARCH_CACHE_SIZE")
+    search_cache_ttl_seconds: float = Field(default=30.0, ge=0, le=3600, alias="DOCULENS_SEARCH_CACHE_TTL_SECONDS")
+    qa_cache_size: int = Field(default=256, ge=0, le=10000, alias="DOCULENS_QA_CACHE_SIZE")
+    qa_cache_similarity: float = Field(default=0.92, ge=0, le=1, alias="DOCULENS_QA_CACHE_SIMILARITY")
+    qa_cache_ttl_seconds: float = Field(default=60.0, ge=0, le=86400, alias="DOCULENS_QA_CACHE_TTL_SECONDS")
+    label_cache_ttl_seconds: float = Field(default=60.0, ge=0, le=3600, alias="DOCULENS_LABEL_CACHE_TTL_SECONDS")
+    db_pool_size: int = Field(default=10, ge=1, le=200, alias="DOCULENS_DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, ge=0, le=200, alias="DOCULENS_DB_MAX_OVERFLOW")
     provider_timeout_seconds: float = Field(default=30.0, ge=1, le=300, alias="DOCULENS_PROVIDER_TIMEOUT_SECONDS")
     max_upload_bytes: int = Field(default=25 * 1024 * 1024, ge=1024, alias="DOCULENS_MAX_UPLOAD_BYTES")
     auth_secret_key: str = Field(default="doculens-dev-secret", alias="DOCULENS_AUTH_SECRET")
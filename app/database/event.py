@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from app.database.session import Base
@@ -54,3 +54,33 @@ class Event(Base):
         onupdate=datetime.now,
         doc="Timestamp when the event was last updated",
     )
+
+    __table_args__ = (
+        # Partial index behind document lifecycle lookups: newest upload event
+        # for a document id. Queries must use the same jsonb_extract_path_text
+        # expression (see upload_document_id_expression) to hit it.
+        Index(
+            "ix_events_upload_document_id",
+            func.jsonb_extract_path_text(task_context, "metadata", "document", "id"),
+            created_at.desc(),
+            postgresql_where=data["event_type"].astext == "document_upload",
+        ),
+        # Partial index for the "does this document already have a summary event"
+        # check made after every upload. Queries must compare
+        # summary_document_id_expression() to hit it.
+        Index(
+            "ix_events_summary_document_id",
+            data["document_id"].astext,
+            postgresql_where=data["event_type"].astext == "document_summary",
+        ),
+    )
+
+
+def upload_document_id_expression():
+    """SQL expression for the document id stored on an upload event's task context."""
+    return func.jsonb_extract_path_text(Event.task_context, "metadata", "document", "id")
+
+
+def summary_document_id_expression():
+    """SQL expression for the document id a summary event was raised for."""
+    return Event.data["document_id"].astext
@@ -1,6 +1,10 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from contextlib import contextmanager
+from typing import Iterator
 
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+
+from app.config.settings import get_settings
 from app.database.database_utils import DatabaseUtils
 
 """
@@ -9,6 +13,33 @@ Session Module
 This module provides a session for database operations.
 """
 
-engine = create_engine(DatabaseUtils.get_connection_string())
+
+def _create_engine() -> Engine:
+    settings = get_settings()
+    # Every request dependency in one request shares a single session (FastAPI caches
+    # Depends(db_session)), so the pool only needs to cover concurrent requests and
+    # workers; the SQLAlchemy default of 5 + 10 left API threads queueing for it.
+    return create_engine(
+        DatabaseUtils.get_connection_string(),
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+
+
+engine = _create_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Session for code outside a request: commit on success, roll back on error."""
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
@@ -0,0 +1,137 @@
+"""Streaming document downloads with parallel byte-range fetches."""
+
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+import httpx
+
+from app.services.http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 2 * 1024 * 1024
+# Bytes held in memory per in-flight stream while copying to disk.
+WRITE_BUFFER_SIZE = 1024 * 1024
+MAX_WORKERS = 8
+MAX_ATTEMPTS = 4
+TIMEOUT_SECONDS = 30
+
+T = TypeVar("T")
+
+
+class _RetryableResponse(Exception):
+    """Raised for server errors that are worth retrying."""
+
+
+def _with_retries(operation: Callable[[], T], description: str) -> T:
+    """Retry transient failures with exponential backoff and full jitter."""
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            return operation()
+        except (httpx.TransportError, _RetryableResponse) as exc:
+            if attempt == MAX_ATTEMPTS:
+                raise
+            delay = random.uniform(0, 0.5 * 2**attempt)
+            logger.warning("%s failed (%s); retrying in %.2fs", description, exc, delay)
+            time.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    if response.status_code >= 500:
+        raise _RetryableResponse(f"HTTP {response.status_code}")
+    response.raise_for_status()
+
+
+def _probe(client: httpx.Client, url: str) -> Tuple[Optional[int], bool]:
+    """Return ``(content_length, accepts_ranges)`` from a HEAD request."""
+
+    def head() -> httpx.Response:
+        response = client.head(url, timeout=TIMEOUT_SECONDS)
+        if response.status_code >= 500:
+            raise _RetryableResponse(f"HTTP {response.status_code}")
+        return response
+
+    try:
+        response = _with_retries(head, f"HEAD {url}")
+    except (httpx.HTTPError, _RetryableResponse):
+        return None, False
+    if not response.is_success:
+        return None, False
+    length = response.headers.get("Content-Length")
+    accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+    return (int(length) if length and length.isdigit() else None), accepts_ranges
+
+
+def _stream_to_file(client: httpx.Client, url: str, local_path: Path) -> None:
+    def fetch() -> None:
+        with client.stream("GET", url, timeout=TIMEOUT_SECONDS) as response:
+            _raise_for_status(response)
+            with local_path.open("wb") as handle:
+                for block in response.iter_bytes(chunk_size=WRITE_BUFFER_SIZE):
+                    handle.write(block)
+
+    _with_retries(fetch, f"GET {url}")
+
+
+def _fetch_range(client: httpx.Client, url: str, local_path: Path, start: int, end: int) -> None:
+    def fetch() -> None:
+        headers = {"Range": f"bytes={start}-{end}"}
+        with client.stream("GET", url, headers=headers, timeout=TIMEOUT_SECONDS) as response:
+            _raise_for_status(response)
+            if response.status_code != 206:
+                raise ValueError(f"Server ignored range request for {url}")
+            with local_path.open("r+b") as handle:
+                handle.seek(start)
+                for block in response.iter_bytes(chunk_size=WRITE_BUFFER_SIZE):
+                    handle.write(block)
+
+    _with_retries(fetch, f"GET {url} [{start}-{end}]")
+
+
+def download_file(
+    url: str,
+    local_path: Path,
+    chunk_size: int = CHUNK_SIZE,
+    max_workers: int = MAX_WORKERS,
+) -> Path:
+    """Download ``url`` to ``local_path`` without buffering the whole body in memory.
+
+    When the server advertises byte ranges and the file spans several chunks,
+    the ranges are fetched concurrently and written in place. Otherwise the
+    body is streamed sequentially.
+
+    Args:
+        url: Source URL.
+        local_path: Destination path; overwritten if it exists.
+        chunk_size: Size of each range request in bytes.
+        max_workers: Maximum number of concurrent range requests.
+
+    Returns:
+        The destination path.
+    """
+    local_path = Path(local_path)
+    client = get_http_client()
+    size, accepts_ranges = _probe(client, url)
+    if not accepts_ranges or size is None or size <= chunk_size:
+        _stream_to_file(client, url, local_path)
+        return local_path
+
+    with local_path.open("wb") as handle:
+        handle.truncate(size)
+    ranges: List[Tuple[int, int]] = [
+        (start, min(start + chunk_size, size) - 1) for start in range(0, size, chunk_size)
+    ]
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ranges))) as pool:
+            futures = [pool.submit(_fetch_range, client, url, local_path, start, end) for start, end in ranges]
+            for future in futures:
+                future.result()
+    except ValueError:
+        logger.info("Falling back to a single stream for %s", url)
+        _stream_to_file(client, url, local_path)
+    return local_path
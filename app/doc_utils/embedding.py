@@ -73,11 +73,14 @@ def embed_and_upsert_chunks(
     document_id: Optional[str] = None,
     document_metadata: Optional[Dict[str, Any]] = None,
     vector_store: VectorStore | None = None,
+    chunk_index_offset: int = 0,
 ) -> List[Dict[str, Any]]:
     """Embed chunks in bounded batches and persist them with citation metadata.
 
     The optional store is an intentional injection seam: tests and alternative
     vector backends do not need to patch module-level SDK clients.
+    ``chunk_index_offset`` keeps chunk indexes continuous when a document is
+    embedded over several calls.
     """
     prepared = [_prepare_text(_chunk_text(chunk)) for chunk in chunks]
     non_empty = [(chunk, text) for chunk, text in zip(chunks, prepared) if text]
@@ -89,10 +92,14 @@ def embed_and_upsert_chunks(
     texts = [text for _, text in non_empty]
     embeddings = store.embed_texts(texts, model=embedding_model)
     base_time = datetime.now(timezone.utc)
-    ids = [str(uuid_from_time(base_time + timedelta(microseconds=index))) for index in range(len(texts))]
+    ids = [
+        str(uuid_from_time(base_time + timedelta(microseconds=index)))
+        for index in range(chunk_index_offset, chunk_index_offset + len(texts))
+    ]
+    token_counts = tokenizer.count_tokens_batch(texts)
     metadata = [
-        _chunk_metadata(chunk, document_id, index, tokenizer.count_tokens(text), document_metadata)
-        for index, ((chunk, text)) in enumerate(non_empty)
+        _chunk_metadata(chunk, document_id, index, token_count, document_metadata)
+        for index, ((chunk, _), token_count) in enumerate(zip(non_empty, token_counts), start=chunk_index_offset)
     ]
     store.upsert(pd.DataFrame({"id": ids, "metadata": metadata, "contents": texts, "embedding": embeddings}))
 
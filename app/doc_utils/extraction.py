@@ -1,20 +1,87 @@
+import hashlib
+import logging
 import os
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
+from typing import Optional
 
 from docling.document_converter import DocumentConverter
+from docling_core.types.doc import DoclingDocument
+
+logger = logging.getLogger(__name__)
 
 EASYOCR_HOME = Path(os.getenv("EASYOCR_HOME", Path.home() / ".EasyOCR"))
 EASYOCR_HOME.mkdir(parents=True, exist_ok=True)
 os.environ.setdefault("EASYOCR_HOME", str(EASYOCR_HOME))
 
+# Converted documents keyed by content hash, so re-uploads of the same file skip
+# OCR and layout analysis. Set DOCULENS_DOCLING_CACHE_DIR to an empty value to disable.
+_cache_dir_setting = os.getenv(
+    "DOCULENS_DOCLING_CACHE_DIR",
+    str(Path(os.getenv("DOCLING_CACHE_DIR", Path.home() / ".cache" / "docling")) / "conversions"),
+)
+DOCLING_CACHE_DIR: Optional[Path] = Path(_cache_dir_setting) if _cache_dir_setting else None
+
+try:
+    _DOCLING_VERSION = version("docling")
+except PackageNotFoundError:  # pragma: no cover - editable/vendored installs
+    _DOCLING_VERSION = "unknown"
+
+
+def _cache_path_for(source: str) -> Optional[Path]:
+    """Return the cache entry for a local file, or None for URLs and disabled caching."""
+    if DOCLING_CACHE_DIR is None:
+        return None
+    path = Path(source)
+    if not path.is_file():
+        return None
+    with path.open("rb") as handle:
+        digest = hashlib.file_digest(handle, "sha256").hexdigest()
+    # Output can change between converter releases, so entries are versioned.
+    return DOCLING_CACHE_DIR / _DOCLING_VERSION / f"{digest}.json"
+
+
+def _load_cached(cache_path: Path) -> Optional[DoclingDocument]:
+    if not cache_path.exists():
+        return None
+    try:
+        return DoclingDocument.load_from_json(cache_path)
+    except Exception as exc:
+        logger.warning("Ignoring unreadable Docling cache entry %s: %s", cache_path, exc)
+        return None
+
+
+def _store_cached(document: DoclingDocument, cache_path: Path) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent workers never read a partial file.
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        document.save_as_json(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as exc:  # pragma: no cover - cache is best effort
+        logger.warning("Failed to cache Docling document at %s: %s", cache_path, exc)
+
+
 def extract_docling_document(source: str):
     """
     Extract a Docling document from a file path or URL.
+
+    Local files are memoized on disk by SHA-256 of their contents.
     Args:
         source (str): Path or URL to the document.
     Returns:
         Docling document object or None if extraction fails.
     """
+    cache_path = _cache_path_for(source)
+    if cache_path is not None:
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            logger.info("Reusing cached Docling conversion for %s", source)
+            return cached
+
     converter = DocumentConverter()
     result = converter.convert(source)
-    return result.document if result else None
+    document = result.document if result else None
+    if document is not None and cache_path is not None:
+        _store_cached(document, cache_path)
+    return document
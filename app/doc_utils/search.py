@@ -1,7 +1,70 @@
-from typing import Any, Dict, List, Optional
+import copy
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+from app.config.settings import get_settings
 from app.services.vector_store import VectorStore
 
+# Dashboards and UI polling resend identical queries; a short-lived process-local
+# cache avoids re-embedding the query and re-running the ANN scan for each poll.
+_SearchKey = Tuple[str, int, str]
+_search_cache: "OrderedDict[_SearchKey, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+_search_cache_lock = Lock()
+
+_META_EXCLUDE = frozenset({"id", "contents", "embedding", "distance"})
+
+
+def _filter_key(metadata_filter: Optional[Dict[str, Any]]) -> str:
+    """Return a canonical encoding of a metadata filter.
+
+    Keys are sorted at every nesting level, so logically equal filters map to
+    the same cache entry regardless of insertion order.
+    """
+    return json.dumps(metadata_filter or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search results, e.g. after documents are re-indexed.
+
+    The cache is per process: archive, delete and restore clear it in the API
+    process, while the cached searches run in Celery workers, so a worker can
+    serve a stale result for up to ``DOCULENS_SEARCH_CACHE_TTL_SECONDS``.
+    """
+    with _search_cache_lock:
+        _search_cache.clear()
+
+
+def _cache_enabled() -> bool:
+    settings = get_settings()
+    return settings.search_cache_size > 0 and settings.search_cache_ttl_seconds > 0
+
+
+def _cache_get(key: _SearchKey) -> Optional[List[Dict[str, Any]]]:
+    now = time.monotonic()
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, cached = entry
+        if expires_at <= now:
+            del _search_cache[key]
+            return None
+        _search_cache.move_to_end(key)
+        return copy.deepcopy(cached)
+
+
+def _cache_put(key: _SearchKey, records: List[Dict[str, Any]]) -> None:
+    settings = get_settings()
+    expires_at = time.monotonic() + settings.search_cache_ttl_seconds
+    with _search_cache_lock:
+        _search_cache[key] = (expires_at, copy.deepcopy(records))
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > settings.search_cache_size:
+            _search_cache.popitem(last=False)
+
 
 def semantic_search_docling(
     query: str,
@@ -10,6 +73,9 @@ def semantic_search_docling(
 ) -> List[Dict[str, Any]]:
     """Perform semantic search over the Docling chunks stored in the vector store.
 
+    Results are cached per ``(query, limit, metadata_filter)`` for
+    ``DOCULENS_SEARCH_CACHE_TTL_SECONDS``. Callers always receive their own copy.
+
     Args:
         query: The search query string.
         limit: The maximum number of results to return.
@@ -18,40 +84,71 @@ def semantic_search_docling(
     Returns:
         List of result dictionaries (safe for JSON serialization).
     """
-    vector_store = VectorStore()
-    results = vector_store.semantic_search(
+    cache_enabled = _cache_enabled()
+    key: _SearchKey = (query, limit, _filter_key(metadata_filter))
+    if cache_enabled and (cached := _cache_get(key)) is not None:
+        return cached
+
+    results = VectorStore().semantic_search(
         query=query,
         limit=limit,
         metadata_filter=metadata_filter,
         return_dataframe=True,
     )
+    normalized_records = _normalize_results(results)
 
+    if cache_enabled:
+        _cache_put(key, normalized_records)
+    return normalized_records
+
+
+async def iter_semantic_search_docling(
+    query: str,
+    limit: int = 5,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Stream normalized search results one row at a time.
+
+    Intended for large ``limit`` values where materializing every record (and a
+    DataFrame) would dominate memory. Results bypass the search cache.
+    """
+    async for row in VectorStore().semantic_search_iter(
+        query=query,
+        limit=limit,
+        metadata_filter=metadata_filter,
+    ):
+        yield _normalize_row(row)
+
+
+def _normalize_row(row: Any) -> Dict[str, Any]:
+    return {
+        "id": str(row[0]),
+        "metadata": row[1] or {},
+        "contents": row[2],
+        "distance": row[4] if len(row) > 4 else None,
+    }
+
+
+def _normalize_results(results: Any) -> List[Dict[str, Any]]:
     normalized_records: List[Dict[str, Any]] = []
 
-    if hasattr(results, "to_dict"):
-        for row in results.to_dict(orient="records"):
-            metadata = {
-                key: value
-                for key, value in row.items()
-                if key not in {"id", "contents", "embedding", "distance"}
-            }
+    if hasattr(results, "itertuples"):
+        # Positional tuples avoid building a dict (and pandas Series) per row.
+        columns = list(results.columns)
+        id_idx = columns.index("id")
+        contents_idx = columns.index("contents")
+        distance_idx = columns.index("distance")
+        meta_idx = [(idx, column) for idx, column in enumerate(columns) if column not in _META_EXCLUDE]
+        for row in results.itertuples(index=False, name=None):
             normalized_records.append(
                 {
-                    "id": str(row.get("id")),
-                    "metadata": metadata,
-                    "contents": row.get("contents"),
-                    "distance": row.get("distance"),
+                    "id": str(row[id_idx]),
+                    "metadata": {column: row[idx] for idx, column in meta_idx},
+                    "contents": row[contents_idx],
+                    "distance": row[distance_idx],
                 }
             )
     else:
-        for row in results:
-            normalized_records.append(
-                {
-                    "id": str(row[0]),
-                    "metadata": row[1] or {},
-                    "contents": row[2],
-                    "distance": row[4] if len(row) > 4 else None,
-                }
-            )
+        normalized_records.extend(_normalize_row(row) for row in results)
 
     return normalized_records
@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, List, Sequence
 
 from docling_core.transforms.chunker.tokenizer.base import BaseTokenizer
 from pydantic import ConfigDict
@@ -23,6 +23,8 @@ class OpenAITokenizerWrapper(BaseTokenizer):
         object.__setattr__(self, "model_name", model_name)
         object.__setattr__(self, "max_length", max_length)
         object.__setattr__(self, "tokenizer", get_encoding(model_name))
+        # Bound once: count_tokens runs thousands of times per document.
+        object.__setattr__(self, "_encode", self.tokenizer.encode_ordinary)
 
     # --- Required abstract methods for BaseTokenizer ---
     def get_tokenizer(self):
@@ -36,11 +38,15 @@ class OpenAITokenizerWrapper(BaseTokenizer):
     # --- Typical tokenizer methods used by HybridChunker ---
     def tokenize(self, text: str) -> List[str]:
         """Tokenize text into token strings."""
-        return [str(t) for t in self.tokenizer.encode(text)]
+        return [str(t) for t in self._encode(text)]
 
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in a string."""
-        return len(self.tokenizer.encode(text))
+        return len(self._encode(text))
+
+    def count_tokens_batch(self, texts: Sequence[str], num_threads: int = 8) -> List[int]:
+        """Count tokens for many strings at once on tiktoken's native thread pool."""
+        return [len(ids) for ids in self.tokenizer.encode_ordinary_batch(list(texts), num_threads=num_threads)]
 
     def detokenize(self, tokens: List[str]) -> str:
         """Reconstruct text from token IDs."""
@@ -1,19 +1,17 @@
 """FastAPI application factory and lifecycle management."""
 
 import logging
-from contextlib import asynccontextmanager, contextmanager
-from typing import Iterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
 
 from app.api.router import router as api_router
 from app.config.settings import Settings, get_settings
 from app.core.observability import configure_logging, request_context_middleware
 from app.database import event as _event_model  # noqa: F401
 from app.database import user as _user_model  # noqa: F401
-from app.database.session import Base, SessionLocal, engine
+from app.database.session import Base, engine, session_scope
 from app.services.auth_service import AuthService
 from app.services.demo_workspace import seed_demo_workspace
 from app.services.vector_store import VectorStore
@@ -26,19 +24,6 @@ DEMO_USERS = [
 ]
 
 
-@contextmanager
-def session_scope() -> Iterator[Session]:
-    session = SessionLocal()
-    try:
-        yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
-
-
 def initialize_dependencies(settings: Settings) -> None:
     """Initialize local-development resources; migrations own production schema."""
     if not settings.initialize_database:
@@ -50,6 +35,7 @@ def initialize_dependencies(settings: Settings) -> None:
     store = VectorStore()
     store.create_tables()
     store.create_keyword_search_index()
+    store.create_index_if_missing()
     if settings.seed_demo_workspace:
         with session_scope() as session:
             inserted = seed_demo_workspace(
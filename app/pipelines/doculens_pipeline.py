@@ -1,9 +1,10 @@
+import json
 import logging
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
-import requests
 from pydantic import BaseModel, Field
 
 from app.api.event_schema import (
@@ -22,14 +23,16 @@ from app.core.llm import LLMNode
 from app.core.pipeline import Pipeline
 from app.core.schema import NodeConfig, PipelineSchema
 from app.doc_utils.chunking import chunk_document
+from app.doc_utils.download import download_file
 from app.doc_utils.embedding import embed_and_upsert_chunks
 from app.doc_utils.extraction import extract_docling_document
-from app.doc_utils.search import semantic_search_docling
+from app.doc_utils.search import clear_search_cache, semantic_search_docling
 from app.services.llm_factory import LLMFactory
 from app.services.classification_service import ClassificationResult, ClassificationScore
 from app.services.classification_audit import record_classification_result
 from app.database.session import SessionLocal
 from app.services.prompt_loader import PromptManager
+from app.services.semantic_cache import clear_qa_answer_cache, get_qa_answer_cache
 from app.services.vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
@@ -42,58 +45,77 @@ def _ensure_ingestion_dir() -> Path:
     return INGESTION_DIR
 
 
-def _require_document_upload_event(event: EventSchema) -> DocumentUploadEvent:
-    if not isinstance(event, DocumentUploadEvent) or event.event_type != "document_upload":
-        raise ValueError(
-            "DoculensDocumentPipeline expects a DocumentUploadEvent with event_type='document_upload'."
-        )
+# event_type -> (expected event model, error raised when a pipeline gets the wrong event)
+_EVENT_REQUIREMENTS: Dict[str, Tuple[type, str]] = {
+    "document_upload": (
+        DocumentUploadEvent,
+        "DoculensDocumentPipeline expects a DocumentUploadEvent with event_type='document_upload'.",
+    ),
+    "document_classification": (
+        DocumentClassificationEvent,
+        "DoculensClassificationPipeline expects a DocumentClassificationEvent with event_type='document_classification'.",
+    ),
+    "information_extraction": (
+        InformationExtractionEvent,
+        "DoculensExtractionPipeline expects an InformationExtractionEvent with event_type='information_extraction'.",
+    ),
+    "document_routing": (
+        DocumentRoutingEvent,
+        "DoculensRoutingPipeline expects a DocumentRoutingEvent with event_type='document_routing'.",
+    ),
+    "search_query": (
+        SearchQueryEvent,
+        "DoculensSearchPipeline expects a SearchQueryEvent with event_type='search_query'.",
+    ),
+    "document_summary": (
+        DocumentSummaryEvent,
+        "DoculensSummaryPipeline expects a DocumentSummaryEvent with event_type='document_summary'.",
+    ),
+    "qa_query": (QAQueryEvent, "DoculensQAPipeline expects a QAQueryEvent with event_type='qa_query'."),
+}
+
+
+def _require_event(event: EventSchema, event_type: str) -> Any:
+    expected_class, message = _EVENT_REQUIREMENTS[event_type]
+    if not isinstance(event, expected_class) or event.event_type != event_type:
+        raise ValueError(message)
     return event
 
 
+def _require_document_upload_event(event: EventSchema) -> DocumentUploadEvent:
+    return _require_event(event, "document_upload")
+
+
 def _require_document_classification_event(event: EventSchema) -> DocumentClassificationEvent:
-    if not isinstance(event, DocumentClassificationEvent) or event.event_type != "document_classification":
-        raise ValueError(
-            "DoculensClassificationPipeline expects a DocumentClassificationEvent with event_type='document_classification'."
-        )
-    return event
+    return _require_event(event, "document_classification")
 
 
 def _require_information_extraction_event(event: EventSchema) -> InformationExtractionEvent:
-    if not isinstance(event, InformationExtractionEvent) or event.event_type != "information_extraction":
-        raise ValueError(
-            "DoculensExtractionPipeline expects an InformationExtractionEvent with event_type='information_extraction'."
-        )
-    return event
+    return _require_event(event, "information_extraction")
 
 
 def _require_document_routing_event(event: EventSchema) -> DocumentRoutingEvent:
-    if not isinstance(event, DocumentRoutingEvent) or event.event_type != "document_routing":
-        raise ValueError(
-            "DoculensRoutingPipeline expects a DocumentRoutingEvent with event_type='document_routing'."
-        )
-    return event
+    return _require_event(event, "document_routing")
 
 
 def _require_search_query_event(event: EventSchema) -> SearchQueryEvent:
-    if not isinstance(event, SearchQueryEvent) or event.event_type != "search_query":
-        raise ValueError(
-            "DoculensSearchPipeline expects a SearchQueryEvent with event_type='search_query'."
-        )
-    return event
+    return _require_event(event, "search_query")
 
 
 def _require_document_summary_event(event: EventSchema) -> DocumentSummaryEvent:
-    if not isinstance(event, DocumentSummaryEvent) or event.event_type != "document_summary":
-        raise ValueError(
-            "DoculensSummaryPipeline expects a DocumentSummaryEvent with event_type='document_summary'."
-        )
-    return event
+    return _require_event(event, "document_summary")
 
 
 def _require_qa_query_event(event: EventSchema) -> QAQueryEvent:
-    if not isinstance(event, QAQueryEvent) or event.event_type != "qa_query":
-        raise ValueError("DoculensQAPipeline expects a QAQueryEvent with event_type='qa_query'.")
-    return event
+    return _require_event(event, "qa_query")
+
+
+def _coerce_chunk_index(value: Any, default: int) -> int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return default
 
 
 class DoculensLLMNode(LLMNode):
@@ -106,16 +128,22 @@ class DoculensLLMNode(LLMNode):
     def __init__(self):
         self._llm = LLMFactory(self.provider)
 
-    def build_messages(self, context: BaseModel) -> List[Dict[str, str]]:
+    @cached_property
+    def system_prompt(self) -> str:
+        """Rendered system prompt; templates take no variables, so render once per node."""
         if not self.prompt_template:
             raise ValueError("prompt_template must be defined for DoculensLLMNode subclasses.")
-        prompt = PromptManager.get_prompt(self.prompt_template)
+        return PromptManager.get_prompt(self.prompt_template)
+
+    def build_user_content(self, context: BaseModel) -> str:
+        """Render the user turn; nodes carrying bulk text override this with plain text."""
+        # Compact JSON: pretty-printing only adds billed whitespace tokens.
+        return context.model_dump_json()
+
+    def build_messages(self, context: BaseModel) -> List[Dict[str, str]]:
         return [
-            {"role": "system", "content": prompt},
-            {
-                "role": "user",
-                "content": context.model_dump_json(indent=2),
-            },
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": self.build_user_content(context)},
         ]
 
     def create_completion(self, context: BaseModel):
@@ -136,10 +164,8 @@ class DoculensLLMNode(LLMNode):
         }
         usage = getattr(raw_completion, "usage", None)
         if usage is not None:
-            if hasattr(usage, "model_dump"):
-                node_result["usage"] = usage.model_dump()
-            else:
-                node_result["usage"] = getattr(usage, "__dict__", usage)
+            dump_usage = getattr(usage, "model_dump", None)
+            node_result["usage"] = dump_usage() if dump_usage is not None else getattr(usage, "__dict__", usage)
 
         task_context.nodes[self.node_name] = node_result
         updated_context = self.after_completion(task_context, response_model)
@@ -150,12 +176,24 @@ class DoculensLLMNode(LLMNode):
         return task_context
 
 
-class ExtractionNode(Node):
-    """Download (if needed) and convert the document into Docling format."""
+class ExtractionChunkingNode(Node):
+    """Download (if needed), convert with Docling and chunk in one step.
+
+    The Docling document is only a local here: it never enters the task
+    context, and is released as soon as its chunks exist, before embedding.
+    """
+
+    SAMPLE_PREVIEWS = 5
+
+    @staticmethod
+    def _render_preview(chunk: Any) -> str:
+        text = getattr(chunk, "text", None) or getattr(chunk, "content", None) or str(chunk)
+        preview = " ".join(text.split())
+        return preview[:200]
 
     def process(self, task_context):
         event = _require_document_upload_event(task_context.event)
-        document_id = task_context.metadata.get("document", {}).get("id", uuid4().hex)
+        document_id = task_context.metadata.setdefault("document", {}).get("id") or uuid4().hex
 
         ingestion_dir = _ensure_ingestion_dir()
         source_name = Path(event.filename or f"{document_id}.bin").name
@@ -163,9 +201,7 @@ class ExtractionNode(Node):
 
         if event.file_url:
             logger.info("Downloading document for ingestion: %s", event.file_url)
-            response = requests.get(event.file_url, timeout=30)
-            response.raise_for_status()
-            local_path.write_bytes(response.content)
+            download_file(event.file_url, local_path)
         else:
             source_path = Path(event.filename)
             if not source_path.exists():
@@ -184,9 +220,17 @@ class ExtractionNode(Node):
         if docling_doc is None:
             raise ValueError("Docling conversion failed to produce a document.")
 
-        page_count = len(getattr(docling_doc, "pages", [])) if hasattr(docling_doc, "pages") else None
+        page_count = len(pages) if (pages := getattr(docling_doc, "pages", None)) is not None else None
+        chunks = chunk_document(docling_doc)
+        del docling_doc
 
-        task_context.state["docling_doc"] = docling_doc
+        chunk_count = len(chunks)
+        previews: List[Dict[str, Any]] = [
+            {"index": idx, "preview": self._render_preview(chunk)}
+            for idx, chunk in enumerate(chunks[: self.SAMPLE_PREVIEWS])
+        ]
+
+        task_context.state["chunks"] = chunks
         task_context.state["local_path"] = str(local_path)
         task_context.metadata["document"] = {
             "id": document_id,
@@ -196,6 +240,7 @@ class ExtractionNode(Node):
             "local_path": str(local_path),
             "ingest_source": event.filename,
             "page_count": page_count,
+            "chunk_count": chunk_count,
             "metadata": event.metadata,
             "doc_type": event.doc_type,
         }
@@ -203,36 +248,6 @@ class ExtractionNode(Node):
             "document_id": document_id,
             "local_path": str(local_path),
             "page_count": page_count,
-        }
-        return task_context
-
-
-class ChunkingNode(Node):
-    """Split the Docling document into embedding-friendly chunks."""
-
-    SAMPLE_PREVIEWS = 5
-
-    @staticmethod
-    def _render_preview(chunk: Any) -> str:
-        text = getattr(chunk, "text", None) or getattr(chunk, "content", None) or str(chunk)
-        preview = " ".join(text.split())
-        return preview[:200]
-
-    def process(self, task_context):
-        docling_doc = task_context.state.get("docling_doc")
-        chunks = chunk_document(docling_doc)
-        task_context.state["chunks"] = chunks
-
-        chunk_count = len(chunks)
-        previews: List[Dict[str, Any]] = [
-            {"index": idx, "preview": self._render_preview(chunk)}
-            for idx, chunk in enumerate(chunks[: self.SAMPLE_PREVIEWS])
-        ]
-
-        document_meta = task_context.metadata.get("document", {})
-        document_meta["chunk_count"] = chunk_count
-
-        task_context.nodes[self.node_name] = {
             "chunk_count": chunk_count,
             "sample_previews": previews,
         }
@@ -242,35 +257,57 @@ class ChunkingNode(Node):
 class EmbeddingNode(Node):
     """Generate embeddings for chunks and upsert them into the vector store."""
 
+    VECTOR_ID_PREVIEW = 20
+
+    # Chunks per embed+upsert round; defaults to DOCULENS_EMBEDDING_BATCH_SIZE so
+    # each round is exactly one provider request.
+    batch_size: Optional[int] = None
+
     def process(self, task_context):
         chunks = task_context.state.get("chunks", [])
         document_meta = task_context.metadata.setdefault("document", {})
         document_id = document_meta.get("id") or uuid4().hex
         document_meta["id"] = document_id
+        document_metadata = {
+            "doc_type": document_meta.get("doc_type"),
+            "original_filename": document_meta.get("original_filename"),
+        }
 
-        summaries = embed_and_upsert_chunks(
-            chunks,
-            document_id=document_id,
-            document_metadata={
-                "doc_type": document_meta.get("doc_type"),
-                "original_filename": document_meta.get("original_filename"),
-            },
-        )
-        chunk_ids = [summary["id"] for summary in summaries]
-        vector_id_preview = chunk_ids[:20]
-
-        document_meta["vector_ids"] = chunk_ids
-        document_meta["embedded_chunk_count"] = len(chunk_ids)
+        batch_size = self.batch_size or get_settings().embedding_batch_size
+        store = VectorStore()
+        summaries: List[Dict[str, Any]] = []
+        for offset in range(0, len(chunks), batch_size):
+            summaries.extend(
+                embed_and_upsert_chunks(
+                    chunks[offset : offset + batch_size],
+                    document_id=document_id,
+                    document_metadata=document_metadata,
+                    vector_store=store,
+                    chunk_index_offset=len(summaries),
+                )
+            )
+        if summaries:
+            # Cached search results and answers predate this document's chunks.
+            clear_search_cache()
+            clear_qa_answer_cache()
+        # Only a bounded sample of ids is persisted; vectors are addressed by
+        # document_id (e.g. purge on delete), so the full list is never needed.
+        embedded_count = len(summaries)
+        vector_id_preview = [summary["id"] for summary in summaries[: self.VECTOR_ID_PREVIEW]]
+        truncated = len(vector_id_preview) < embedded_count
+
+        document_meta["vector_ids"] = vector_id_preview
+        document_meta["vector_ids_truncated"] = truncated
+        document_meta["embedded_chunk_count"] = embedded_count
 
         task_context.nodes[self.node_name] = {
-            "embedded_chunks": len(chunk_ids),
+            "embedded_chunks": embedded_count,
             "vector_ids": vector_id_preview,
-            "vector_ids_truncated": len(vector_id_preview) < len(chunk_ids),
+            "vector_ids_truncated": truncated,
         }
 
         # Cleanup heavy artifacts
         task_context.state.pop("chunks", None)
-        task_context.state.pop("docling_doc", None)
 
         return task_context
 
@@ -293,12 +330,18 @@ class DocumentClassificationNode(DoculensLLMNode):
 
     def get_context(self, task_context):
         event = _require_document_classification_event(task_context.event)
-        return self.ContextModel(
+        return self.ContextModel.model_construct(
             document_id=event.document_id,
             text=event.text,
             metadata=event.metadata,
         )
 
+    def build_user_content(self, context: ContextModel) -> str:
+        header = f"document_id: {context.document_id}\n"
+        if context.metadata:
+            header += f"metadata: {json.dumps(context.metadata, separators=(',', ':'), default=str)}\n"
+        return f"{header}\nText:\n{context.text}"
+
     def after_completion(self, task_context, response_model: ResponseModel):
         task_context.metadata["classification"] = response_model.model_dump()
 
@@ -355,13 +398,20 @@ class InformationExtractionNode(DoculensLLMNode):
 
     def get_context(self, task_context):
         event = _require_information_extraction_event(task_context.event)
-        return self.ContextModel(
+        return self.ContextModel.model_construct(
             document_id=event.document_id,
             doc_type=event.doc_type,
             text=event.text,
             fields=event.fields,
         )
 
+    def build_user_content(self, context: ContextModel) -> str:
+        return (
+            f"document_type: {context.doc_type}\n"
+            f"fields: {', '.join(context.fields)}\n\n"
+            f"Text:\n{context.text}"
+        )
+
     def after_completion(self, task_context, response_model: ResponseModel):
         task_context.metadata["extraction"] = response_model.model_dump()
         return task_context
@@ -387,7 +437,7 @@ class DocumentRoutingNode(DoculensLLMNode):
     def get_context(self, task_context):
         event = _require_document_routing_event(task_context.event)
         additional_metadata = task_context.metadata.get("document") or getattr(event, "metadata", None)
-        return self.ContextModel(
+        return self.ContextModel.model_construct(
             document_id=event.document_id,
             candidate_department=event.target_department,
             reason=event.reason,
@@ -437,7 +487,10 @@ class DocumentSummaryNode(DoculensLLMNode):
             or chunk_meta.get("filename")
         )
 
-        context = self.ContextModel(
+        if not resolved_document_id:
+            raise ValueError("Unable to resolve document_id for the requested summary.")
+
+        context = self.ContextModel.model_construct(
             document_id=resolved_document_id,
             doc_type=resolved_doc_type,
             filename=resolved_filename,
@@ -447,6 +500,13 @@ class DocumentSummaryNode(DoculensLLMNode):
         task_context.state["summary_context"] = context
         return context
 
+    def build_user_content(self, context: ContextModel) -> str:
+        return (
+            f"Document type: {context.doc_type or 'unknown'}\n"
+            f"Filename: {context.filename or 'unknown'}\n\n"
+            "Excerpts:\n" + "\n---\n".join(context.chunk_texts)
+        )
+
     def after_completion(self, task_context, response_model: ResponseModel):
         chunks = task_context.state.pop("summary_chunks", [])
         context: Optional[DocumentSummaryNode.ContextModel] = task_context.state.pop("summary_context", None)
@@ -509,65 +569,101 @@ class QAQueryNode(DoculensLLMNode):
         confidence: Optional[float] = Field(default=None, ge=0.0, le=1.0)
         citations: List[str] = Field(default_factory=list, description="List of chunk references supporting the answer.")
 
+    def process(self, task_context):
+        if self._serve_cached_answer(task_context):
+            return task_context
+        return super().process(task_context)
+
+    def _serve_cached_answer(self, task_context) -> bool:
+        """Answer from the semantic cache when a near-identical question was seen.
+
+        On a miss the query embedding is parked in state so after_completion can
+        store the fresh answer. The embedding is reused by retrieval through the
+        VectorStore embedding cache, so this costs no extra provider call.
+        """
+        cache = get_qa_answer_cache()
+        if cache is None:
+            return False
+        event = _require_qa_query_event(task_context.event)
+        top_k = event.top_k or get_settings().qa_top_k
+        namespace = json.dumps({"filters": event.filters, "top_k": top_k}, sort_keys=True, default=str)
+        embedding = VectorStore().get_embedding(event.query)
+        cached = cache.get(embedding, namespace)
+        if cached is None:
+            task_context.state["qa_cache_key"] = (embedding, namespace)
+            return False
+
+        task_context.state["qa_chunks"] = [self.RetrievedChunk.model_validate(chunk) for chunk in cached["chunks"]]
+        self.after_completion(task_context, self.ResponseModel.model_validate(cached["answer"]))
+        task_context.nodes[self.node_name]["cache_hit"] = True
+        return True
+
     def get_context(self, task_context):
         event = _require_qa_query_event(task_context.event)
-        settings = get_settings()
-        top_k = event.top_k or settings.qa_top_k
+        top_k = event.top_k or get_settings().qa_top_k
         results = semantic_search_docling(
             query=event.query,
             limit=top_k,
             metadata_filter=event.filters,
         )
+        return self._build_context(task_context, event, results)
+
+    def _build_context(self, task_context, event: QAQueryEvent, results: List[Dict[str, Any]]):
         if not results:
             raise ValueError("No semantic matches found for the supplied question. Ensure embeddings exist.")
 
-        chunks: List[QAQueryNode.RetrievedChunk] = []
-        for idx, record in enumerate(results):
-            metadata = record.get("metadata") or {}
-            chunk_index = metadata.get("chunk_index")
-            if isinstance(chunk_index, str) and chunk_index.isdigit():
-                chunk_index_int = int(chunk_index)
-            elif isinstance(chunk_index, int):
-                chunk_index_int = chunk_index
-            else:
-                chunk_index_int = idx
-            reference = metadata.get("reference") or f"{metadata.get('document_id', 'doc')}#chunk-{chunk_index_int}"
-            chunks.append(
-                self.RetrievedChunk(
-                    reference=str(reference),
-                    document_id=metadata.get("document_id"),
-                    filename=metadata.get("filename"),
-                    chunk_index=chunk_index_int,
-                    text=record.get("contents", ""),
-                )
+        # Field-wise passes over the records; the values are already normalized
+        # by the search layer, so chunks are built without re-validation.
+        metadatas = [record.get("metadata") or {} for record in results]
+        chunk_indexes = [
+            _coerce_chunk_index(metadata.get("chunk_index"), idx) for idx, metadata in enumerate(metadatas)
+        ]
+        references = [
+            str(metadata.get("reference") or f"{metadata.get('document_id', 'doc')}#chunk-{chunk_index}")
+            for metadata, chunk_index in zip(metadatas, chunk_indexes)
+        ]
+        construct = self.RetrievedChunk.model_construct
+        chunks: List[QAQueryNode.RetrievedChunk] = [
+            construct(
+                reference=reference,
+                document_id=metadata.get("document_id"),
+                filename=metadata.get("filename"),
+                chunk_index=chunk_index,
+                text=record.get("contents") or "",
             )
-        context = self.ContextModel(query=event.query, chunks=chunks)
+            for record, metadata, chunk_index, reference in zip(results, metadatas, chunk_indexes, references)
+        ]
+        context = self.ContextModel.model_construct(query=event.query, chunks=chunks)
         task_context.state["qa_chunks"] = chunks
         return context
 
-    def build_messages(self, context: ContextModel) -> List[Dict[str, str]]:
-        prompt = PromptManager.get_prompt(self.prompt_template)
-        context_blocks = []
-        for idx, chunk in enumerate(context.chunks, start=1):
-            header = f"[{idx}] ref={chunk.reference}"
-            if chunk.document_id:
-                header += f" | document_id={chunk.document_id}"
-            if chunk.filename:
-                header += f" | filename={chunk.filename}"
-            context_blocks.append(f"{header}\n{chunk.text}")
-        user_content = (
-            f"Question:\n{context.query}\n\n"
-            "Context passages:\n"
-            + "\n\n".join(context_blocks)
+    _PASSAGE_TEMPLATE = "[{index}] ref={reference}{document}{filename}\n{text}"
+
+    def build_user_content(self, context: ContextModel) -> str:
+        passages = "\n\n".join(
+            self._PASSAGE_TEMPLATE.format(
+                index=idx,
+                reference=chunk.reference,
+                document=f" | document_id={chunk.document_id}" if chunk.document_id else "",
+                filename=f" | filename={chunk.filename}" if chunk.filename else "",
+                text=chunk.text,
+            )
+            for idx, chunk in enumerate(context.chunks, start=1)
         )
-        return [
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": user_content},
-        ]
+        return f"Question:\n{context.query}\n\nContext passages:\n{passages}"
 
     def after_completion(self, task_context, response_model: ResponseModel):
         chunks: List[QAQueryNode.RetrievedChunk] = task_context.state.pop("qa_chunks", [])
         task_context.metadata["qa"] = response_model.model_dump()
+        cache_key = task_context.state.pop("qa_cache_key", None)
+        cache = get_qa_answer_cache()
+        if cache_key is not None and cache is not None:
+            embedding, namespace = cache_key
+            cache.put(
+                embedding,
+                {"answer": response_model.model_dump(), "chunks": [chunk.model_dump() for chunk in chunks]},
+                namespace,
+            )
         task_context.metadata["qa"]["used_chunks"] = [chunk.reference for chunk in chunks]
 
         task_context.nodes[self.node_name] = {
@@ -621,10 +717,9 @@ class SemanticSearchNode(Node):
 
 class DoculensDocumentPipeline(Pipeline):
     pipeline_schema = PipelineSchema(
-        start=ExtractionNode,
+        start=ExtractionChunkingNode,
         nodes=[
-            NodeConfig(node=ExtractionNode, connections=[ChunkingNode]),
-            NodeConfig(node=ChunkingNode, connections=[EmbeddingNode]),
+            NodeConfig(node=ExtractionChunkingNode, connections=[EmbeddingNode]),
             NodeConfig(node=EmbeddingNode, connections=[]),
         ],
     )
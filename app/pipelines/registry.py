@@ -1,4 +1,5 @@
 import logging
+from threading import Lock
 from typing import Dict, Type
 
 from app.api.event_schema import EventSchema
@@ -21,6 +22,8 @@ and their mappings. It determines which pipeline to use based on event attribute
 currently using email addresses as the routing mechanism.
 """
 
+logger = logging.getLogger(__name__)
+
 class PipelineRegistry:
     """Registry for managing and routing to different pipeline implementations.
 
@@ -48,6 +51,12 @@ class PipelineRegistry:
         "qa_query": DoculensQAPipeline,
     }
 
+    # Pipelines and their nodes keep no per-run state (everything lives on the
+    # TaskContext), so one instance per type is reused across events. Built
+    # lazily because node construction creates provider SDK clients.
+    _instances: Dict[str, Pipeline] = {}
+    _instances_lock = Lock()
+
     @staticmethod
     def get_pipeline_type(event: EventSchema) -> str:
         """Determines the appropriate pipeline type based on event attributes.
@@ -61,22 +70,29 @@ class PipelineRegistry:
         event_type = getattr(event, "event_type", None)
         if event_type in PipelineRegistry.pipelines:
             return event_type
-        logging.warning("Unknown event_type '%s'; falling back to default pipeline.", event_type)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Unknown event_type '%s'; falling back to default pipeline.", event_type)
         return "default"
 
-    @staticmethod
-    def get_pipeline(event: EventSchema) -> Pipeline:
-        """Creates and returns the appropriate pipeline instance for the event.
+    @classmethod
+    def get_pipeline(cls, event: EventSchema) -> Pipeline:
+        """Returns the shared pipeline instance for the event.
 
         Args:
             event: Event schema containing routing information
 
         Returns:
-            Instantiated pipeline object for processing the event
+            Pipeline object for processing the event
         """
-        pipeline_type = PipelineRegistry.get_pipeline_type(event)
-        pipeline = PipelineRegistry.pipelines.get(pipeline_type)
-        if pipeline:
-            logging.info(f"Using pipeline: {pipeline.__name__}")
-            return pipeline()
-        raise ValueError(f"Unknown pipeline type: {pipeline_type}")
+        pipeline = cls._instances.get(getattr(event, "event_type", None))
+        if pipeline is not None:
+            return pipeline
+
+        pipeline_type = cls.get_pipeline_type(event)
+        with cls._instances_lock:
+            pipeline = cls._instances.get(pipeline_type)
+            if pipeline is None:
+                pipeline_class = cls.pipelines[pipeline_type]
+                logger.info("Initializing pipeline: %s", pipeline_class.__name__)
+                pipeline = cls._instances[pipeline_type] = pipeline_class()
+        return pipeline
@@ -1,20 +1,89 @@
 from __future__ import annotations
 
+import hashlib
+import hmac
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, Optional
+from threading import Lock
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, make_transient_to_detached
 
-from app.api.dependencies import db_session
+from app.api.dependencies import BearerToken, db_session
 from app.config.settings import get_settings
 from app.database.user import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-bearer_scheme = HTTPBearer(auto_error=False)
+# New hashes use argon2id; bcrypt stays listed so existing hashes still verify
+# and are upgraded on the next successful login.
+pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
+bearer_scheme = BearerToken(auto_error=False, scheme_name="HTTPBearer")
+
+# Password hashing runs here so it can overlap database round trips; the argon2
+# and bcrypt backends release the GIL. Threads are only started on first use.
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
+# Successful logins are remembered briefly so repeat logins skip the KDF. Keys
+# are HMACs under a per-process random key, so no password-derived value
+# outlives the process or is comparable across workers.
+VERIFY_CACHE_SIZE = 256
+VERIFY_CACHE_TTL_SECONDS = 300
+_verify_cache: "OrderedDict[str, float]" = OrderedDict()
+_verify_cache_lock = Lock()
+_verify_cache_key = os.urandom(32)
+
+
+# Users resolved from bearer tokens, cached as detached snapshots so most
+# authenticated requests skip the users lookup. Entries live for at most
+# USER_CACHE_TTL_SECONDS (and never past the token's expiry), which bounds how
+# long a deactivation can go unnoticed without an explicit evict_cached_user().
+USER_CACHE_SIZE = 1024
+USER_CACHE_TTL_SECONDS = 60
+_user_cache: "OrderedDict[str, Tuple[float, User]]" = OrderedDict()
+_user_cache_lock = Lock()
+
+
+def evict_cached_user(user_id: object) -> None:
+    """Drop a cached token user, e.g. after its account was changed or deactivated."""
+    with _user_cache_lock:
+        _user_cache.pop(str(user_id), None)
+
+
+def _cached_user(user_id: str) -> Optional[User]:
+    now = time.monotonic()
+    with _user_cache_lock:
+        entry = _user_cache.get(user_id)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del _user_cache[user_id]
+            return None
+        _user_cache.move_to_end(user_id)
+        return entry[1]
+
+
+def _cache_user(user: User, token_exp: Optional[float]) -> None:
+    snapshot = User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+    make_transient_to_detached(snapshot)
+    expires_at = time.monotonic() + USER_CACHE_TTL_SECONDS
+    if token_exp is not None:
+        expires_at = min(expires_at, time.monotonic() + (token_exp - time.time()))
+    with _user_cache_lock:
+        _user_cache[str(user.id)] = (expires_at, snapshot)
+        while len(_user_cache) > USER_CACHE_SIZE:
+            _user_cache.popitem(last=False)
+
+
+def _verify_cache_token(password: str, hashed: str) -> str:
+    message = password.encode("utf-8") + b"\0" + hashed.encode("utf-8")
+    return hmac.new(_verify_cache_key, message, hashlib.sha256).hexdigest()
 
 
 ROLE_DEFINITIONS: Dict[str, Dict[str, str]] = {
@@ -59,6 +128,16 @@ ROLE_DEFINITIONS: Dict[str, Dict[str, str]] = {
 PERSONA_OPTIONS = ["analyst", "manager", "reviewer", "developer", "executive"]
 
 
+def _normalize_profile(persona: str, role: str, access_level: Optional[str]) -> tuple[str, str, str]:
+    """Return the stored (persona, role, access_level) values for a requested profile."""
+    role_key = role.lower()
+    persona_value = persona.lower()
+    if persona_value not in PERSONA_OPTIONS:
+        persona_value = PERSONA_OPTIONS[0]
+    derived_access = ROLE_DEFINITIONS.get(role_key, {}).get("access_level", "standard")
+    return persona_value, role_key, access_level or derived_access
+
+
 class AuthService:
     """Service wrapper for user and token operations."""
 
@@ -73,6 +152,31 @@ class AuthService:
     def verify_password(password: str, hashed: str) -> bool:
         return pwd_context.verify(password, hashed)
 
+    @staticmethod
+    def verify_password_cached(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """Verify a login password, reusing recent successful verifications.
+
+        Returns ``(valid, new_hash)`` where ``new_hash`` is set when the stored
+        hash uses a deprecated scheme and should be replaced.
+        """
+        token = _verify_cache_token(password, hashed)
+        now = time.monotonic()
+        with _verify_cache_lock:
+            expires_at = _verify_cache.get(token)
+            if expires_at is not None:
+                if expires_at > now:
+                    _verify_cache.move_to_end(token)
+                    return True, None
+                del _verify_cache[token]
+
+        valid, new_hash = pwd_context.verify_and_update(password, hashed)
+        if valid and new_hash is None:
+            with _verify_cache_lock:
+                _verify_cache[token] = now + VERIFY_CACHE_TTL_SECONDS
+                while len(_verify_cache) > VERIFY_CACHE_SIZE:
+                    _verify_cache.popitem(last=False)
+        return valid, new_hash
+
     def get_user_by_email(self, email: str) -> Optional[User]:
         return (
             self.session.query(User)
@@ -84,8 +188,13 @@ class AuthService:
         user = self.get_user_by_email(email=email)
         if not user or not user.is_active:
             return None
-        if not self.verify_password(password, user.hashed_password):
+        valid, new_hash = self.verify_password_cached(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            user.hashed_password = new_hash
+            self.session.add(user)
+            self.session.commit()
         return user
 
     def create_user(
@@ -99,13 +208,7 @@ class AuthService:
         access_level: Optional[str] = None,
     ) -> User:
         existing = self.get_user_by_email(email=email)
-
-        role_key = role.lower()
-        persona_value = persona.lower()
-        if persona_value not in PERSONA_OPTIONS:
-            persona_value = PERSONA_OPTIONS[0]
-        derived_access = ROLE_DEFINITIONS.get(role_key, {}).get("access_level", "standard")
-        desired_access = access_level or derived_access
+        persona_value, role_key, desired_access = _normalize_profile(persona, role, access_level)
 
         if existing:
             updated = False
@@ -129,6 +232,7 @@ class AuthService:
                 self.session.add(existing)
                 self.session.commit()
                 self.session.refresh(existing)
+                evict_cached_user(existing.id)
             return existing
 
         user = User(
@@ -145,54 +249,132 @@ class AuthService:
         return user
 
     def ensure_seed_users(self, seeds: Iterable[Dict[str, str]]) -> None:
+        """Create any missing seed accounts in a single statement.
+
+        Seeding is create-only: accounts that already exist are left untouched,
+        so warm restarts cost one SELECT and no password hashing. ``ON CONFLICT``
+        keeps concurrent workers from racing on the unique email index.
+        Passwords for new accounts are hashed concurrently on the shared hash
+        executor.
+        """
+        seeds = list(seeds)
+        if not seeds:
+            return
+
+        emails = [seed["email"].lower() for seed in seeds]
+        known = set(self.session.execute(select(User.email).where(User.email.in_(emails))).scalars())
+
+        new_seeds = []
         for seed in seeds:
-            self.create_user(**seed)
+            email = seed["email"].lower()
+            if email in known:
+                continue
+            known.add(email)
+            new_seeds.append((email, seed))
+        if not new_seeds:
+            return
 
+        hashes = list(_hash_executor.map(self.hash_password, [seed["password"] for _, seed in new_seeds]))
 
-def create_access_token(*, user: User) -> str:
+        rows = []
+        for (email, seed), hashed_password in zip(new_seeds, hashes):
+            persona_value, role_key, desired_access = _normalize_profile(
+                seed["persona"], seed["role"], seed.get("access_level")
+            )
+            rows.append(
+                {
+                    "email": email,
+                    "hashed_password": hashed_password,
+                    "full_name": seed["full_name"],
+                    "persona": persona_value,
+                    "role": role_key,
+                    "access_level": desired_access,
+                }
+            )
+        self.session.execute(
+            pg_insert(User).values(rows).on_conflict_do_nothing(index_elements=[User.email])
+        )
+        self.session.commit()
+
+
+class _AuthSettings(NamedTuple):
+    secret_key: str
+    algorithms: List[str]
+    token_lifetime: timedelta
+
+
+_auth_settings: Optional[_AuthSettings] = None
+
+
+def refresh_auth_settings() -> _AuthSettings:
+    """Re-read the JWT settings; call after changing auth configuration at runtime."""
+    global _auth_settings
     settings = get_settings()
-    expire_minutes = settings.auth_token_exp_minutes
-    expire_at = datetime.now(timezone.utc) + timedelta(minutes=expire_minutes)
+    _auth_settings = _AuthSettings(
+        secret_key=settings.auth_secret_key,
+        algorithms=[settings.auth_algorithm],
+        token_lifetime=timedelta(minutes=settings.auth_token_exp_minutes),
+    )
+    return _auth_settings
+
+
+def _get_auth_settings() -> _AuthSettings:
+    # Resolved on first use rather than at import so importing this module never
+    # requires a fully configured environment.
+    return _auth_settings or refresh_auth_settings()
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials.",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def create_access_token(*, user: User) -> str:
+    auth = _get_auth_settings()
     payload = {
         "sub": str(user.id),
         "email": user.email,
         "role": user.role,
         "persona": user.persona,
-        "exp": expire_at,
+        "exp": datetime.now(timezone.utc) + auth.token_lifetime,
     }
-    return jwt.encode(payload, settings.auth_secret_key, algorithm=settings.auth_algorithm)
+    return jwt.encode(payload, auth.secret_key, algorithm=auth.algorithms[0])
 
 
 def decode_access_token(token: str, session: Session) -> User:
-    settings = get_settings()
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials.",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    auth = _get_auth_settings()
     try:
-        payload = jwt.decode(token, settings.auth_secret_key, algorithms=[settings.auth_algorithm])
+        payload = jwt.decode(token, auth.secret_key, algorithms=auth.algorithms)
         user_id = payload.get("sub")
     except JWTError as exc:
-        raise credentials_exception from exc
+        raise _credentials_exception() from exc
 
     if not user_id:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    cached = _cached_user(str(user_id))
+    if cached is not None:
+        # merge(load=False) attaches a per-request copy without querying.
+        return session.merge(cached, load=False)
 
     user = session.query(User).filter(User.id == user_id).first()
     if not user or not user.is_active:
-        raise credentials_exception
+        raise _credentials_exception()
+    _cache_user(user, payload.get("exp"))
     return user
 
 
 def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    token: Optional[str] = Depends(bearer_scheme),
     session: Session = Depends(db_session),
 ) -> User:
-    if credentials is None:
+    if token is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing authorization credentials.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return decode_access_token(credentials.credentials, session)
+    return decode_access_token(token, session)
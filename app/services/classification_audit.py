@@ -3,15 +3,15 @@ from __future__ import annotations
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
 
 from app.database.event import Event
 from app.database.models import DocumentClassificationHistory
-from app.database.repository import GenericRepository
-from app.services.classification_service import ClassificationResult
-from app.services.document_lifecycle import get_upload_event_for_document
+from app.services.classification_service import ClassificationResult, dump_scores
+from app.services.document_lifecycle import get_upload_event_for_document, json_child
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +22,12 @@ def _update_document_metadata_from_classification(
     result: ClassificationResult,
     *,
     source: str,
+    scores: Optional[List[Dict[str, Any]]] = None,
 ) -> None:
-    """Ensure the primary document metadata reflects the latest classification."""
+    """Ensure the primary document metadata reflects the latest classification.
+
+    ``scores`` takes the already-dumped ``result.scores`` when the caller has them.
+    """
     if not result.label:
         return
 
@@ -35,42 +39,31 @@ def _update_document_metadata_from_classification(
 
     timestamp = datetime.now(timezone.utc).isoformat()
 
-    task_context = dict(upload_event.task_context or {})
-    metadata_block = dict(task_context.get("metadata") or {})
-    document_meta = dict(metadata_block.get("document") or {})
-
-    # Preserve nested metadata bag if present.
-    nested_metadata = document_meta.get("metadata")
-
-    document_meta["doc_type"] = result.label
-    document_meta["candidate_labels"] = list(result.candidate_labels)
-    document_meta["classification"] = {
+    classification = {
         "label": result.label,
         "confidence": result.confidence,
-        "scores": [score.model_dump() for score in result.scores],
+        "scores": scores if scores is not None else dump_scores(result.scores),
         "reasoning": result.reasoning,
         "source": source,
         "updated_at": timestamp,
     }
-    if nested_metadata is not None:
-        document_meta["metadata"] = nested_metadata
 
-    metadata_block["document"] = document_meta
-    metadata_block["classification"] = {
-        "label": result.label,
-        "confidence": result.confidence,
-        "scores": [score.model_dump() for score in result.scores],
-        "reasoning": result.reasoning,
-        "source": source,
-        "updated_at": timestamp,
-    }
+    # Edit the JSONB payloads in place and flag them, instead of copying each level.
+    if not isinstance(upload_event.task_context, dict):
+        upload_event.task_context = {}
+    metadata_block = json_child(upload_event.task_context, "metadata")
+    document_meta = json_child(metadata_block, "document")
 
-    task_context["metadata"] = metadata_block
-    upload_event.task_context = task_context
-    upload_event.data = {
-        **(upload_event.data or {}),
-        "doc_type": result.label,
-    }
+    document_meta["doc_type"] = result.label
+    document_meta["candidate_labels"] = list(result.candidate_labels)
+    document_meta["classification"] = classification
+    metadata_block["classification"] = dict(classification)
+
+    if not isinstance(upload_event.data, dict):
+        upload_event.data = {}
+    upload_event.data["doc_type"] = result.label
+    flag_modified(upload_event, "task_context")
+    flag_modified(upload_event, "data")
     session.add(upload_event)
 
 
@@ -85,9 +78,16 @@ def record_classification_result(
     metadata_extra: Optional[Dict[str, object]] = None,
     notes: Optional[str] = None,
 ) -> DocumentClassificationHistory:
-    repository = GenericRepository(session=session, model=Event)
-    repository.create(
-        obj=Event(
+    """Record a classification as an audit event, a history row and document metadata.
+
+    Everything is written in one transaction. The returned history row is
+    expired by the commit and loads its server-side defaults (``created_at``)
+    on first access, so callers that ignore it pay no extra query.
+    """
+    # Dumped once and shared by the event, history row and document metadata.
+    scores = dump_scores(result.scores)
+    session.add(
+        Event(
             data={
                 "event_type": "document_classification_local",
                 "document_id": document_id,
@@ -102,7 +102,7 @@ def record_classification_result(
                     "classification": {
                         "label": result.label,
                         "confidence": result.confidence,
-                        "scores": [score.model_dump() for score in result.scores],
+                        "scores": scores,
                         "classifier_version": classifier_version,
                         "reasoning": result.reasoning,
                     }
@@ -113,7 +113,7 @@ def record_classification_result(
 
     metadata_payload: Dict[str, object] = {
         "candidate_labels": result.candidate_labels,
-        "scores": [score.model_dump() for score in result.scores],
+        "scores": scores,
     }
     if metadata_extra:
         metadata_payload.update(metadata_extra)
@@ -137,7 +137,7 @@ def record_classification_result(
         document_id,
         result,
         source=source,
+        scores=scores,
     )
     session.commit()
-    session.refresh(history_entry)
     return history_entry
@@ -2,22 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from functools import lru_cache
-from typing import List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from openai import OpenAI
-from pydantic import BaseModel
+from openai import AsyncOpenAI, OpenAI
+from pydantic import BaseModel, TypeAdapter
+
+from app.services.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent classification requests per batch.
+MAX_INFLIGHT = 8
+
 
 class ClassificationScore(BaseModel):
     label: str
     score: float
 
 
+_SCORES_ADAPTER = TypeAdapter(List[ClassificationScore])
+
+
+def dump_scores(scores: Sequence[ClassificationScore]) -> List[Dict[str, Any]]:
+    """Serialize scores in one pydantic-core call instead of one model_dump per score."""
+    return _SCORES_ADAPTER.dump_python(list(scores))
+
+
 class ClassificationResult(BaseModel):
     label: str
     confidence: float
@@ -27,30 +41,30 @@ class ClassificationResult(BaseModel):
     reasoning: Optional[str] = None
 
 
-class OpenAIClassificationService:
-    """Use OpenAI's Responses API to classify a document into one of the provided labels."""
-
-    DEFAULT_MODEL = "gpt-4.1-mini"
-
-    def __init__(self, *, model: str = DEFAULT_MODEL):
-        self.model = model
-        self.client = OpenAI()
-
-    def classify(
-        self,
-        *,
-        text: str,
-        candidate_labels: Sequence[str],
-        hypothesis_template: Optional[str] = None,  # kept for signature compatibility
-        multi_label: bool = False,  # kept for signature compatibility
-    ) -> ClassificationResult:
-        if not text.strip():
-            raise ValueError("Document text cannot be empty for classification.")
-        if not candidate_labels:
-            raise ValueError("Candidate labels must be provided for classification.")
-
-        formatted_labels = "\n".join(f"- {label}" for label in candidate_labels)
-        prompt = f"""
+def _strip_code_fence(payload: str) -> str:
+    """Drop a surrounding Markdown code fence (```json ... ```) from a model reply."""
+    payload = payload.strip()
+    if not payload.startswith("```"):
+        return payload
+    # Slice off the opening fence line and the closing fence, without splitting every line.
+    body = payload.partition("\n")[2]
+    closing = body.rfind("\n```")
+    if closing != -1:
+        body = body[:closing]
+    elif body.startswith("```"):
+        body = ""
+    return body.strip()
+
+
+@lru_cache(maxsize=64)
+def _label_request_parts(candidate_labels: Tuple[str, ...]) -> Tuple[str, Dict[str, Any]]:
+    """Return the prompt scaffold (up to the document text) and output format for a label set.
+
+    The label taxonomy rarely changes, so both are built once per distinct set.
+    Callers must treat the returned format as read-only.
+    """
+    formatted_labels = "\n".join(f"- {label}" for label in candidate_labels)
+    prompt_prefix = f"""
 You are a document router. Select the single best matching label for the document from the list below.
 Labels:
 {formatted_labels}
@@ -63,14 +77,47 @@ Return a JSON object with this schema:
 }}
 
 Document:
-{text}
 """
+    # Structured output keeps the reply to bare JSON with a label from the list.
+    response_format = {
+        "type": "json_schema",
+        "name": "document_label",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "label": {"type": "string", "enum": list(candidate_labels)},
+                "confidence": {"type": "number"},
+                "reason": {"type": "string"},
+            },
+            "required": ["label", "confidence", "reason"],
+            "additionalProperties": False,
+        },
+    }
+    return prompt_prefix, {"format": response_format}
 
-        logger.debug("Classifying document using OpenAI model=%s labels=%d", self.model, len(candidate_labels))
-        response = self.client.responses.create(
-            model=self.model,
-            input=prompt,
-        )
+
+class OpenAIClassificationService:
+    """Use OpenAI's Responses API to classify a document into one of the provided labels."""
+
+    DEFAULT_MODEL = "gpt-4.1-mini"
+
+    def __init__(self, *, model: str = DEFAULT_MODEL):
+        self.model = model
+        self.client = OpenAI(http_client=get_http_client())
+
+    @staticmethod
+    def _build_request(text: str, candidate_labels: Sequence[str]) -> Dict[str, Any]:
+        if not text.strip():
+            raise ValueError("Document text cannot be empty for classification.")
+        if not candidate_labels:
+            raise ValueError("Candidate labels must be provided for classification.")
+
+        prompt_prefix, text_format = _label_request_parts(tuple(candidate_labels))
+        return {"input": f"{prompt_prefix}{text}\n", "text": text_format}
+
+    @staticmethod
+    def _parse_response(response: Any, text: str, candidate_labels: Sequence[str]) -> ClassificationResult:
         payload = getattr(response, "output_text", None)
         if not payload:
             try:
@@ -81,15 +128,7 @@ Document:
         if not payload:
             raise RuntimeError("OpenAI classification response did not contain any text output.")
 
-        payload = payload.strip()
-        if payload.startswith("```"):
-            payload_lines = payload.splitlines()
-            if payload_lines and payload_lines[0].startswith("```"):
-                payload_lines = payload_lines[1:]
-            if payload_lines and payload_lines[-1].startswith("```"):
-                payload_lines = payload_lines[:-1]
-            payload = "\n".join(payload_lines).strip()
-
+        payload = _strip_code_fence(payload)
         try:
             data = json.loads(payload)
         except json.JSONDecodeError as exc:
@@ -109,6 +148,66 @@ Document:
             reasoning=reason,
         )
 
+    def classify(
+        self,
+        *,
+        text: str,
+        candidate_labels: Sequence[str],
+        hypothesis_template: Optional[str] = None,  # kept for signature compatibility
+        multi_label: bool = False,  # kept for signature compatibility
+    ) -> ClassificationResult:
+        request = self._build_request(text, candidate_labels)
+        logger.debug("Classifying document using OpenAI model=%s labels=%d", self.model, len(candidate_labels))
+        response = self.client.responses.create(model=self.model, **request)
+        return self._parse_response(response, text, candidate_labels)
+
+    async def _aclassify_with(
+        self, client: AsyncOpenAI, text: str, candidate_labels: Sequence[str]
+    ) -> ClassificationResult:
+        request = self._build_request(text, candidate_labels)
+        response = await client.responses.create(model=self.model, **request)
+        return self._parse_response(response, text, candidate_labels)
+
+    async def _gather(
+        self,
+        client: AsyncOpenAI,
+        texts: Sequence[str],
+        candidate_labels: Sequence[str],
+        max_inflight: int,
+        return_exceptions: bool,
+    ) -> List[Union[ClassificationResult, BaseException]]:
+        semaphore = asyncio.Semaphore(max(1, max_inflight))
+
+        async def classify_one(text: str) -> ClassificationResult:
+            async with semaphore:
+                return await self._aclassify_with(client, text, candidate_labels)
+
+        return await asyncio.gather(
+            *(classify_one(text) for text in texts), return_exceptions=return_exceptions
+        )
+
+    def classify_many(
+        self,
+        texts: Sequence[str],
+        candidate_labels: Sequence[str],
+        *,
+        max_inflight: int = MAX_INFLIGHT,
+        return_exceptions: bool = False,
+    ) -> List[Union[ClassificationResult, BaseException]]:
+        """Classify several texts concurrently against the same labels, blocking until done.
+
+        Meant for synchronous callers (e.g. Celery). Results keep the order of
+        ``texts``. With ``return_exceptions`` a failed item yields its exception
+        instead of cancelling the batch.
+        """
+
+        async def run() -> List[Union[ClassificationResult, BaseException]]:
+            # A client scoped to this event loop; pooled connections cannot outlive it.
+            async with AsyncOpenAI() as client:
+                return await self._gather(client, texts, candidate_labels, max_inflight, return_exceptions)
+
+        return asyncio.run(run())
+
     @property
     def version(self) -> str:
         return f"openai:{self.model}"
@@ -5,10 +5,14 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, Optional
 
+from fastapi import BackgroundTasks
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
 
-from app.database.event import Event
+from app.database.event import Event, upload_document_id_expression
+from app.doc_utils.search import clear_search_cache
+from app.services.semantic_cache import clear_qa_answer_cache
 from app.services.vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
@@ -21,7 +25,7 @@ def get_upload_event_for_document(session: Session, document_id: str) -> Optiona
         .filter(
             and_(
                 Event.data["event_type"].astext == "document_upload",
-                Event.task_context["metadata"]["document"]["id"].astext == document_id,
+                upload_document_id_expression() == document_id,
             )
         )
         .order_by(Event.created_at.desc())
@@ -50,30 +54,15 @@ def archive_document(
     reason: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Soft-archive a document without removing underlying data."""
-    upload_event = get_upload_event_for_document(session, document_id)
-    if not upload_event:
-        raise ValueError("Document not found.")
-
-    timestamp = datetime.now(timezone.utc).isoformat()
-    _apply_status_to_upload_event(
-        upload_event,
+    timestamp = _transition_document(
+        session,
+        document_id,
         status="archived",
-        timestamp=timestamp,
+        event_type="document_archived",
+        reason=reason,
         flags={"archived": True},
     )
 
-    archive_event = Event(
-        data={
-            "event_type": "document_archived",
-            "document_id": document_id,
-            "archived_at": timestamp,
-            "reason": reason,
-        }
-    )
-    session.add(archive_event)
-    session.add(upload_event)
-    session.commit()
-
     return {
         "document_id": document_id,
         "status": "archived",
@@ -87,37 +76,27 @@ def delete_document(
     *,
     reason: Optional[str] = None,
     purge_vectors: bool = True,
+    background_tasks: Optional[BackgroundTasks] = None,
 ) -> Dict[str, Any]:
-    """Soft-delete a document and optionally purge its vector embeddings."""
-    upload_event = get_upload_event_for_document(session, document_id)
-    if not upload_event:
-        raise ValueError("Document not found.")
-
-    timestamp = datetime.now(timezone.utc).isoformat()
-    _apply_status_to_upload_event(
-        upload_event,
+    """Soft-delete a document and optionally purge its vector embeddings.
+
+    With ``background_tasks`` the purge runs after the response is sent, so the
+    caller only waits for the soft-delete commit.
+    """
+    timestamp = _transition_document(
+        session,
+        document_id,
         status="deleted",
-        timestamp=timestamp,
+        event_type="document_deleted",
+        reason=reason,
         flags={"deleted": True},
     )
 
-    delete_event = Event(
-        data={
-            "event_type": "document_deleted",
-            "document_id": document_id,
-            "deleted_at": timestamp,
-            "reason": reason,
-        }
-    )
-    session.add(delete_event)
-    session.add(upload_event)
-    session.commit()
-
     if purge_vectors:
-        try:
-            VectorStore().delete(metadata_filter={"document_id": document_id})
-        except Exception as exc:  # pragma: no cover - best effort cleanup
-            logger.warning("Vector purge failed for document %s: %s", document_id, exc)
+        if background_tasks is not None:
+            background_tasks.add_task(purge_document_vectors, document_id)
+        else:
+            purge_document_vectors(document_id)
 
     return {
         "document_id": document_id,
@@ -126,6 +105,18 @@ def delete_document(
     }
 
 
+def purge_document_vectors(document_id: str) -> None:
+    """Best-effort removal of a document's embeddings from the vector store."""
+    try:
+        VectorStore().delete(metadata_filter={"document_id": document_id})
+    except Exception as exc:  # pragma: no cover - best effort cleanup
+        logger.warning("Vector purge failed for document %s: %s", document_id, exc)
+    # Searches and answers made between the status change and the purge may have
+    # re-cached the document's chunks.
+    clear_search_cache()
+    clear_qa_answer_cache()
+
+
 def restore_document(
     session: Session,
     document_id: str,
@@ -133,42 +124,77 @@ def restore_document(
     reason: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Restore a previously archived document to active processing."""
+    timestamp = _transition_document(
+        session,
+        document_id,
+        status="processing",
+        event_type="document_restored",
+        reason=reason,
+        clear_keys={"archived", "archived_at"},
+        stamp_flag="restored_at",
+    )
+
+    return {
+        "document_id": document_id,
+        "status": "processing",
+        "restored_at": timestamp,
+    }
+
+
+def _transition_document(
+    session: Session,
+    document_id: str,
+    *,
+    status: str,
+    event_type: str,
+    reason: Optional[str],
+    flags: Optional[Dict[str, Any]] = None,
+    clear_keys: Optional[Iterable[str]] = None,
+    stamp_flag: Optional[str] = None,
+) -> str:
+    """Apply a lifecycle status to the upload event and append its audit event.
+
+    Shared by archive, delete and restore so the steps live in one place. The
+    audit event carries only a small ``data`` payload and is what the events
+    feed shows for the transition. ``stamp_flag`` names an extra flag set to the transition time.
+    Returns the transition timestamp.
+    """
     upload_event = get_upload_event_for_document(session, document_id)
     if not upload_event:
         raise ValueError("Document not found.")
 
     timestamp = datetime.now(timezone.utc).isoformat()
+    if stamp_flag:
+        flags = {**(flags or {}), stamp_flag: timestamp}
     _apply_status_to_upload_event(
         upload_event,
-        status="processing",
+        status=status,
         timestamp=timestamp,
-        clear_keys={"archived", "archived_at"},
-        flags={"restored_at": timestamp},
+        flags=flags,
+        clear_keys=clear_keys,
     )
-
-    restore_event = Event(
-        data={
-            "event_type": "document_restored",
-            "document_id": document_id,
-            "restored_at": timestamp,
-            "reason": reason,
-        }
+    session.add(
+        Event(
+            data={
+                "event_type": event_type,
+                "document_id": document_id,
+                f"{event_type.removeprefix('document_')}_at": timestamp,
+                "reason": reason,
+            }
+        )
     )
-    session.add(restore_event)
-    session.add(upload_event)
     session.commit()
-
-    return {
-        "document_id": document_id,
-        "status": "processing",
-        "restored_at": timestamp,
-    }
+    clear_search_cache()
+    clear_qa_answer_cache()
+    return timestamp
 
 
-def _ensure_dict(value: Any) -> Dict[str, Any]:
-    if isinstance(value, dict):
-        return dict(value)
-    return {}
+def json_child(parent: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Return ``parent[key]`` for in-place edits, replacing a missing or non-dict value."""
+    value = parent.get(key)
+    if not isinstance(value, dict):
+        value = parent[key] = {}
+    return value
 
 
 def _apply_status_to_upload_event(
@@ -179,53 +205,32 @@ def _apply_status_to_upload_event(
     flags: Optional[Dict[str, Any]] = None,
     clear_keys: Optional[Iterable[str]] = None,
 ) -> None:
-    """Mutate an upload event so downstream listings pick up the new lifecycle state."""
-    task_context = _ensure_dict(upload_event.task_context)
-    metadata_block = _ensure_dict(task_context.get("metadata"))
-    document_meta = _ensure_dict(metadata_block.get("document"))
-    nested_metadata = _ensure_dict(document_meta.get("metadata"))
-
-    clear_set = set(clear_keys or {})
-    for key in clear_set:
+    """Mutate an upload event so downstream listings pick up the new lifecycle state.
+
+    The JSONB payloads are edited in place and flagged as modified, rather than
+    rebuilt level by level.
+    """
+    if not isinstance(upload_event.task_context, dict):
+        upload_event.task_context = {}
+    if not isinstance(upload_event.data, dict):
+        upload_event.data = {}
+    metadata_block = json_child(upload_event.task_context, "metadata")
+    document_meta = json_child(metadata_block, "document")
+    nested_metadata = json_child(document_meta, "metadata")
+    upload_meta = json_child(upload_event.data, "metadata")
+
+    status_fields = {"status": status, f"{status}_at": timestamp, **(flags or {})}
+    for key in clear_keys or ():
         document_meta.pop(key, None)
         nested_metadata.pop(key, None)
         metadata_block.pop(key, None)
+        upload_meta.pop(key, None)
 
-    document_meta.update(
-        {
-            "status": status,
-            f"{status}_at": timestamp,
-        }
-    )
-    nested_metadata.update(
-        {
-            "status": status,
-            f"{status}_at": timestamp,
-        }
-    )
-    if flags:
-        document_meta.update(flags)
-        nested_metadata.update(flags)
-
-    document_meta["metadata"] = nested_metadata
-    metadata_block["document"] = document_meta
+    document_meta.update(status_fields)
+    nested_metadata.update(status_fields)
+    upload_meta.update(status_fields)
     metadata_block["status"] = status
     metadata_block[f"{status}_at"] = timestamp
 
-    task_context["metadata"] = metadata_block
-    upload_event.task_context = task_context
-
-    upload_data = _ensure_dict(upload_event.data)
-    upload_meta = _ensure_dict(upload_data.get("metadata"))
-    for key in clear_set:
-        upload_meta.pop(key, None)
-    upload_meta.update(
-        {
-            "status": status,
-            f"{status}_at": timestamp,
-        }
-    )
-    if flags:
-        upload_meta.update(flags)
-    upload_data["metadata"] = upload_meta
-    upload_event.data = upload_data
+    flag_modified(upload_event, "task_context")
+    flag_modified(upload_event, "data")
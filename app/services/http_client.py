@@ -0,0 +1,28 @@
+"""Shared outbound HTTP connection pool.
+
+SDK clients (OpenAI, Anthropic) and document downloads are created per request
+or per pipeline node. Handing them one pooled ``httpx.Client`` keeps TCP/TLS
+connections alive across those short-lived objects.
+"""
+
+from functools import lru_cache
+
+import httpx
+
+from app.config.settings import get_settings
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client."""
+    return httpx.Client(
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        timeout=get_settings().provider_timeout_seconds,
+    )
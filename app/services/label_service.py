@@ -1,18 +1,32 @@
 from __future__ import annotations
 
 import logging
+import time
 import uuid
 from collections import defaultdict
+from threading import Lock
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from sqlalchemy import and_, asc, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.config.settings import get_settings
 from app.database.models import DocumentLabel
 
 logger = logging.getLogger(__name__)
 
+# Candidate label names per workspace, read on every classification. Mutations
+# through LabelService clear the whole cache (global labels are visible to every
+# workspace); other processes pick up changes once the TTL lapses.
+_candidate_cache: Dict[Optional[uuid.UUID], Tuple[float, List[str]]] = {}
+_candidate_cache_lock = Lock()
+
+
+def clear_candidate_label_cache() -> None:
+    with _candidate_cache_lock:
+        _candidate_cache.clear()
+
 
 class LabelConflictError(ValueError):
     """Raised when attempting to create a duplicate label within a workspace."""
@@ -45,6 +59,14 @@ class LabelService:
 
     def get_candidate_labels(self) -> List[str]:
         """Return just the label names that are eligible for classification (non-domain)."""
+        ttl_seconds = get_settings().label_cache_ttl_seconds
+        now = time.monotonic()
+        if ttl_seconds > 0:
+            with _candidate_cache_lock:
+                cached = _candidate_cache.get(self.workspace_id)
+            if cached and cached[0] > now:
+                return list(cached[1])
+
         query = (
             select(DocumentLabel.label_name)
             .where(
@@ -55,16 +77,22 @@ class LabelService:
             )
             .order_by(asc(DocumentLabel.label_name))
         )
-        return [row[0] for row in self.session.execute(query)]
+        labels = [row[0] for row in self.session.execute(query)]
+        if ttl_seconds > 0:
+            with _candidate_cache_lock:
+                _candidate_cache[self.workspace_id] = (now + ttl_seconds, labels)
+        return list(labels)
 
     def get_label_tree(self) -> List[Dict[str, object]]:
         """Return label hierarchy grouped by domain."""
         rows = self.list_flat_labels()
-        domain_map: Dict[Optional[uuid.UUID], Dict[str, object]] = {}
-        children_map: Dict[Optional[uuid.UUID], List[Dict[str, object]]] = defaultdict(list)
+        tree: List[Dict[str, object]] = []
+        domain_index: Dict[uuid.UUID, Dict[str, object]] = {}
+        # Children seen before their domain (rows are ordered by name, not type).
+        pending: Dict[Optional[uuid.UUID], List[Dict[str, object]]] = defaultdict(list)
 
         for label in rows:
-            node = {
+            node: Dict[str, object] = {
                 "id": str(label.id),
                 "name": label.label_name,
                 "type": label.label_type,
@@ -73,23 +101,16 @@ class LabelService:
                 "parent_id": str(label.parent_label_id) if label.parent_label_id else None,
             }
             if label.label_type == "domain" or label.parent_label_id is None:
-                domain_map[label.id] = {**node, "children": []}
+                node["children"] = pending.pop(label.id, [])
+                domain_index[label.id] = node
+                tree.append(node)
+            elif label.parent_label_id in domain_index:
+                domain_index[label.parent_label_id]["children"].append(node)  # type: ignore[union-attr]
             else:
-                children_map[label.parent_label_id].append(node)
+                pending[label.parent_label_id].append(node)
 
-        # Attach children to domains; orphan labels (no domain) go under None bucket.
-        tree: List[Dict[str, object]] = []
-        for domain_id, domain_node in domain_map.items():
-            domain_node["children"] = children_map.get(domain_id, [])
-            tree.append(domain_node)
-
-        # Handle orphan labels (no parent and not registered as domain)
-        orphans = [
-            node
-            for parent_id, nodes in children_map.items()
-            if parent_id not in domain_map
-            for node in nodes
-        ]
+        # Whatever is still pending has no domain among the visible labels.
+        orphans = [node for nodes in pending.values() for node in nodes]
         if orphans:
             tree.append(
                 {
@@ -132,6 +153,7 @@ class LabelService:
             self.session.rollback()
             logger.warning("Duplicate label attempted: %s", label_name)
             raise LabelConflictError(f"Label '{label_name}' already exists for this workspace.") from exc
+        clear_candidate_label_cache()
         self.session.refresh(label)
         return label
 
@@ -161,6 +183,7 @@ class LabelService:
         except IntegrityError as exc:
             self.session.rollback()
             raise LabelConflictError(f"Label '{label_name}' already exists for this workspace.") from exc
+        clear_candidate_label_cache()
         self.session.refresh(label)
         return label
 
@@ -175,3 +198,4 @@ class LabelService:
 
         self.session.delete(label)
         self.session.commit()
+        clear_candidate_label_cache()
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Type, Tuple
 import instructor
 from anthropic import Anthropic
 from app.config.settings import get_settings
+from app.services.http_client import get_http_client
 from openai import OpenAI
 from pydantic import BaseModel
 
@@ -39,7 +40,9 @@ class OpenRouterProvider(LLMProvider):
         self.client = self._initialize_client()
 
     def _initialize_client(self) -> Any:
-        return instructor.from_openai(OpenAI(api_key=self.settings.api_key, base_url=self.settings.base_url))
+        return instructor.from_openai(
+            OpenAI(api_key=self.settings.api_key, base_url=self.settings.base_url, http_client=get_http_client())
+        )
     
     def create_completion(
         self, response_model: Type[BaseModel], messages: List[Dict[str, str]], **kwargs
@@ -62,7 +65,7 @@ class OpenAIProvider(LLMProvider):
         self.client = self._initialize_client()
 
     def _initialize_client(self) -> Any:
-        return instructor.from_openai(OpenAI(api_key=self.settings.api_key))
+        return instructor.from_openai(OpenAI(api_key=self.settings.api_key, http_client=get_http_client()))
 
     def create_completion(
         self, response_model: Type[BaseModel], messages: List[Dict[str, str]], **kwargs
@@ -86,7 +89,7 @@ class AnthropicProvider(LLMProvider):
         self.client = self._initialize_client()
 
     def _initialize_client(self) -> Any:
-        return instructor.from_anthropic(Anthropic(api_key=self.settings.api_key))
+        return instructor.from_anthropic(Anthropic(api_key=self.settings.api_key, http_client=get_http_client()))
 
     def create_completion(
         self, response_model: Type[BaseModel], messages: List[Dict[str, str]], **kwargs
@@ -119,7 +122,7 @@ class LlamaProvider(LLMProvider):
 
     def _initialize_client(self) -> Any:
         return instructor.from_openai(
-            OpenAI(base_url=self.settings.base_url, api_key=self.settings.api_key),
+            OpenAI(base_url=self.settings.base_url, api_key=self.settings.api_key, http_client=get_http_client()),
             mode=instructor.Mode.JSON,
         )
 
@@ -1,6 +1,9 @@
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple
+
 import frontmatter
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateError, meta
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template, TemplateError, meta
 
 """
 Prompt Management Module
@@ -54,6 +57,20 @@ class PromptManager:
             )
         return cls._env
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _load_template(template: str) -> Tuple[frontmatter.Post, Template]:
+        """Reads, parses and compiles a template once per process.
+
+        Prompts ship with the code, so they only change on deploy; call
+        ``PromptManager._load_template.cache_clear()`` to pick up edits.
+        """
+        env = PromptManager._get_env()
+        template_path = f"{template}.j2"
+        with open(env.loader.get_source(env, template_path)[1]) as file:
+            post = frontmatter.load(file)
+        return post, env.from_string(post.content)
+
     @staticmethod
     def get_prompt(template: str, **kwargs) -> str:
         """Loads and renders a prompt template with provided variables.
@@ -69,14 +86,9 @@ class PromptManager:
             ValueError: If template rendering fails
             FileNotFoundError: If template file doesn't exist
         """
-        env = PromptManager._get_env()
-        template_path = f"{template}.j2"
-        with open(env.loader.get_source(env, template_path)[1]) as file:
-            post = frontmatter.load(file)
-
-        template = env.from_string(post.content)
+        _, compiled = PromptManager._load_template(template)
         try:
-            return template.render(**kwargs)
+            return compiled.render(**kwargs)
         except TemplateError as e:
             raise ValueError(f"Error rendering template: {str(e)}")
 
@@ -98,12 +110,8 @@ class PromptManager:
         Raises:
             FileNotFoundError: If template file doesn't exist
         """
-        env = PromptManager._get_env()
-        template_path = f"{template}.j2"
-        with open(env.loader.get_source(env, template_path)[1]) as file:
-            post = frontmatter.load(file)
-
-        ast = env.parse(post.content)
+        post, _ = PromptManager._load_template(template)
+        ast = PromptManager._get_env().parse(post.content)
         variables = meta.find_undeclared_variables(ast)
 
         return {
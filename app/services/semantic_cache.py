@@ -0,0 +1,101 @@
+"""Process-local cache that matches entries by embedding similarity."""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import count
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.config.settings import get_settings
+
+
+class SemanticCache:
+    """Bounded LRU cache looked up by cosine similarity instead of exact keys.
+
+    Entries live in a namespace (for QA: the retrieval filters and ``top_k``),
+    so a similar question asked against different documents never matches.
+    Lookups are a brute-force dot product over normalized vectors, which is
+    cheap at the few hundred entries this cache is sized for.
+    """
+
+    def __init__(self, max_entries: int, threshold: float, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, Tuple[str, np.ndarray, float, Any]]" = OrderedDict()
+        self._ids = count()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else None
+
+    def get(self, embedding: Sequence[float], namespace: str = "") -> Optional[Any]:
+        """Return the value of the most similar live entry above the threshold."""
+        query = self._normalize(embedding)
+        if query is None:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            for entry_id in [key for key, entry in self._entries.items() if entry[2] <= now]:
+                del self._entries[entry_id]
+            candidates: List[Tuple[int, np.ndarray]] = [
+                (entry_id, entry[1])
+                for entry_id, entry in self._entries.items()
+                if entry[0] == namespace and entry[1].shape == query.shape
+            ]
+            if not candidates:
+                return None
+            similarities = np.stack([vector for _, vector in candidates]) @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            entry_id = candidates[best][0]
+            self._entries.move_to_end(entry_id)
+            return self._entries[entry_id][3]
+
+    def put(self, embedding: Sequence[float], value: Any, namespace: str = "") -> None:
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[next(self._ids)] = (namespace, vector, expires_at, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@lru_cache(maxsize=1)
+def get_qa_answer_cache() -> Optional[SemanticCache]:
+    """Return the shared QA answer cache, or None when disabled in settings."""
+    settings = get_settings()
+    if settings.qa_cache_size <= 0 or settings.qa_cache_ttl_seconds <= 0:
+        return None
+    return SemanticCache(
+        max_entries=settings.qa_cache_size,
+        threshold=settings.qa_cache_similarity,
+        ttl_seconds=settings.qa_cache_ttl_seconds,
+    )
+
+
+def clear_qa_answer_cache() -> None:
+    """Drop cached answers, e.g. after documents are ingested, archived or deleted.
+
+    Only this process's cache is cleared; other API and worker processes rely on
+    ``DOCULENS_QA_CACHE_TTL_SECONDS`` to bound how long they keep stale answers.
+    """
+    cache = get_qa_answer_cache()
+    if cache is not None:
+        cache.clear()
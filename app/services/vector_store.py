@@ -1,14 +1,20 @@
+import asyncio
 import logging
+import weakref
 from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 import psycopg2
+import psycopg2.extras
+import psycopg2.pool
 from psycopg2.extras import RealDictCursor
 from app.config.settings import get_settings
+from app.services.http_client import get_http_client
 from openai import OpenAI
 from timescale_vector import client
 
@@ -24,11 +30,47 @@ and supports both exact and approximate nearest neighbor search through Streamin
 """
 
 
+class _SharedSyncClient(client.Sync):
+    """Timescale Vector sync client whose connection pool is safe to share across threads.
+
+    The stock client lazily builds a SimpleConnectionPool, which is not
+    thread-safe; API worker threads share one client per table.
+    """
+
+    _pool_lock = Lock()
+
+    @contextmanager
+    def connect(self):
+        if self.pool is None:
+            with self._pool_lock:
+                if self.pool is None:
+                    if self.max_db_connections is None:
+                        self.max_db_connections = self.default_max_db_connections()
+                    self.pool = psycopg2.pool.ThreadedConnectionPool(
+                        1,
+                        self.max_db_connections,
+                        dsn=self.service_url,
+                        cursor_factory=psycopg2.extras.DictCursor,
+                    )
+        with super().connect() as connection:
+            yield connection
+
+
 class VectorStore:
     """A class for managing vector operations and database interactions."""
 
     _embedding_cache: "OrderedDict[tuple[str, str], List[float]]" = OrderedDict()
     _cache_lock = Lock()
+    # asyncpg pools are expensive to build but bound to the loop that created
+    # them, so async clients are shared per (database, table) within each loop.
+    _async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple[str, str], client.Async]]" = (
+        weakref.WeakKeyDictionary()
+    )
+    # VectorStore is constructed per request; the clients behind it (and their
+    # connection pools) are shared so requests reuse warm connections.
+    _sync_clients: Dict[tuple[str, str], client.Sync] = {}
+    _openai_clients: Dict[tuple[Optional[str], float, int], OpenAI] = {}
+    _clients_lock = Lock()
 
     def __init__(self, local: bool = False):
         """
@@ -38,21 +80,52 @@ class VectorStore:
             local (bool): If True, overrides .env to use localhost DB for running outside Docker.
         """
         self.settings = get_settings()
-        self.openai_client = OpenAI(
-            api_key=self.settings.llm.openai.api_key,
-            timeout=self.settings.provider_timeout_seconds,
-            max_retries=self.settings.llm.openai.max_retries,
-        )
         self.embedding_model = self.settings.llm.openai.embedding_model
         self.vector_settings = self.settings.database.vector_store
-        database_url = self.settings.database.service_url_for(local=local)
-        self.database_url = database_url
-        self.vec_client = client.Sync(
-            database_url,
-            self.vector_settings.table_name,
-            self.vector_settings.embedding_dimensions,
-            time_partition_interval=self.vector_settings.time_partition_interval,
+        self.database_url = self.settings.database.service_url_for(local=local)
+
+        openai_key = (
+            self.settings.llm.openai.api_key,
+            self.settings.provider_timeout_seconds,
+            self.settings.llm.openai.max_retries,
         )
+        sync_key = (self.database_url, self.vector_settings.table_name)
+        with self._clients_lock:
+            self.openai_client = self._openai_clients.get(openai_key)
+            if self.openai_client is None:
+                self.openai_client = self._openai_clients[openai_key] = OpenAI(
+                    api_key=openai_key[0],
+                    timeout=openai_key[1],
+                    max_retries=openai_key[2],
+                    http_client=get_http_client(),
+                )
+            self.vec_client = self._sync_clients.get(sync_key)
+            if self.vec_client is None:
+                self.vec_client = self._sync_clients[sync_key] = _SharedSyncClient(
+                    self.database_url,
+                    self.vector_settings.table_name,
+                    self.vector_settings.embedding_dimensions,
+                    time_partition_interval=self.vector_settings.time_partition_interval,
+                )
+
+    @property
+    def async_vec_client(self) -> client.Async:
+        """Return the asyncpg-backed Timescale Vector client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        key = (self.database_url, self.vector_settings.table_name)
+        with self._clients_lock:
+            loop_clients = self._async_clients.get(loop)
+            if loop_clients is None:
+                loop_clients = self._async_clients[loop] = {}
+            async_client = loop_clients.get(key)
+            if async_client is None:
+                async_client = loop_clients[key] = client.Async(
+                    self.database_url,
+                    self.vector_settings.table_name,
+                    self.vector_settings.embedding_dimensions,
+                    time_partition_interval=self.vector_settings.time_partition_interval,
+                )
+        return async_client
 
     def create_keyword_search_index(self):
         """Create a GIN index for keyword search if it doesn't exist."""
@@ -122,6 +195,26 @@ class VectorStore:
         """Create the StreamingDiskANN index to spseed up similarity search"""
         self.vec_client.create_embedding_index(client.DiskAnnIndex())
 
+    def create_index_if_missing(self) -> None:
+        """Create the StreamingDiskANN index unless it already exists.
+
+        Without it every semantic search is an exact scan over all embeddings.
+        The index is maintained on insert, so creating it once at startup
+        (even on an empty table) keeps later uploads indexed.
+        """
+        index_name = f"{self.vector_settings.table_name}_embedding_idx"
+        try:
+            with psycopg2.connect(self.database_url) as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT to_regclass(%s)", (index_name,))
+                    exists = cur.fetchone()[0] is not None
+            if exists:
+                return
+            self.create_index()
+            logging.info(f"Embedding index '{index_name}' created.")
+        except Exception as e:
+            logging.error(f"Error while creating embedding index: {str(e)}")
+
     def drop_index(self) -> None:
         """Drop the StreamingDiskANN index in the database"""
         self.vec_client.drop_embedding_index()
@@ -189,8 +282,52 @@ class VectorStore:
                 vector_store.semantic_search("Recent updates", time_range=(datetime(2024, 1, 1), datetime(2024, 1, 31)))
         """
         query_embedding = self.get_embedding(query)
+        search_args = self._build_search_args(limit, metadata_filter, predicates, time_range)
+        results = self.vec_client.search(query_embedding, **search_args)
 
-        search_args = {
+        if return_dataframe:
+            return self._create_dataframe_from_results(results)
+        else:
+            return results
+
+    async def semantic_search_iter(
+        self,
+        query: str,
+        limit: int = 5,
+        metadata_filter: Union[dict, List[dict]] = None,
+        predicates: Optional[client.Predicates] = None,
+        time_range: Optional[Tuple[datetime, datetime]] = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Any]:
+        """Yield raw search records from a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so large ``limit`` values
+        never hold the full result set in memory.
+        """
+        query_embedding = await asyncio.to_thread(self.get_embedding, query)
+        search_args = self._build_search_args(limit, metadata_filter, predicates, time_range)
+        vec_client = self.async_vec_client
+        sql, params = vec_client.builder.search_query(
+            query_embedding,
+            search_args["limit"],
+            search_args.get("filter"),
+            search_args.get("predicates"),
+            search_args.get("uuid_time_filter"),
+        )
+        async with await vec_client.connect() as connection:
+            # asyncpg cursors only exist inside a transaction.
+            async with connection.transaction():
+                async for record in connection.cursor(sql, *params, prefetch=batch_size):
+                    yield record
+
+    @staticmethod
+    def _build_search_args(
+        limit: int,
+        metadata_filter: Union[dict, List[dict], None],
+        predicates: Optional[client.Predicates],
+        time_range: Optional[Tuple[datetime, datetime]],
+    ) -> Dict[str, Any]:
+        search_args: Dict[str, Any] = {
             "limit": limit,
         }
 
@@ -204,12 +341,7 @@ class VectorStore:
             start_date, end_date = time_range
             search_args["uuid_time_filter"] = client.UUIDTimeRange(start_date, end_date)
 
-        results = self.vec_client.search(query_embedding, **search_args)
-
-        if return_dataframe:
-            return self._create_dataframe_from_results(results)
-        else:
-            return results
+        return search_args
 
     def _create_dataframe_from_results(
         self,
@@ -1,19 +1,19 @@
 import logging
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_
+from sqlalchemy import and_, cast, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 
-from app.api.dependencies import db_session
 from app.api.event_schema import EventSchema
 from app.config.celery_config import celery_app
 from app.config.settings import get_settings
-from app.database.event import Event
+from app.database.event import Event, summary_document_id_expression
 from app.database.models import DocumentClassificationHistory
-from app.database.repository import GenericRepository
+from app.database.session import session_scope
 from app.pipelines.registry import PipelineRegistry
 from app.services.classification_audit import record_classification_result
-from app.services.classification_service import get_classification_service
+from app.services.classification_service import MAX_INFLIGHT, dump_scores, get_classification_service
 from app.services.label_service import LabelService
 from pydantic import TypeAdapter
 
@@ -41,19 +41,23 @@ def process_incoming_event(event_id: str):
     Args:
         event_id: Unique identifier of the event to process
     """
-    with contextmanager(db_session)() as session:
-        repository = GenericRepository(session=session, model=Event)
-
-        db_event = repository.get(id=event_id)
-        if db_event is None:
+    with session_scope() as session:
+        event_data = session.execute(select(Event.data).where(Event.id == event_id)).scalar_one_or_none()
+        if event_data is None:
             raise ValueError(f"Event with id {event_id} not found")
 
-        event = event_schema_adapter.validate_python(db_event.data)
+        event = event_schema_adapter.validate_python(event_data)
         pipeline = PipelineRegistry.get_pipeline(event)
 
         task_context = pipeline.run(event)
-        db_event.task_context = task_context.model_dump(mode="json")
-        repository.update(obj=db_event)
+        # Serialize once in pydantic-core and let Postgres parse the text, instead of
+        # building a dict tree that SQLAlchemy would json.dumps again.
+        session.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(task_context=cast(literal(task_context.model_dump_json()), JSONB))
+        )
+        session.commit()
 
         try:
             if event.event_type == "document_upload":
@@ -64,6 +68,35 @@ def process_incoming_event(event_id: str):
             logger.exception("Post-processing hook failed for event %s", event_id)
 
 
+@celery_app.task(name="classify_document")
+def classify_document_task(document_id: str, text: str, candidate_labels: List[str]) -> Dict[str, Any]:
+    """Classify a document off the request path and record the result.
+
+    The return value is the classification response body, read back by the
+    classification status endpoint from the result backend.
+    """
+    classifier = get_classification_service()
+    result = classifier.classify(text=text, candidate_labels=candidate_labels)
+    with session_scope() as session:
+        record_classification_result(
+            session,
+            document_id,
+            result,
+            source="ai",
+            classifier_version=getattr(classifier, "version", None),
+            metadata_extra={"reasoning": result.reasoning} if result.reasoning else None,
+        )
+    return {
+        "document_id": document_id,
+        "predicted_label": result.label,
+        "confidence": result.confidence,
+        "scores": dump_scores(result.scores),
+        "candidate_labels": result.candidate_labels,
+        "used_text_preview": result.used_text[:500],
+        "reasoning": result.reasoning,
+    }
+
+
 def _schedule_post_ingestion_jobs(session, task_context) -> None:
     metadata = task_context.metadata or {}
     document_meta: Dict[str, Any] = metadata.get("document") or {}
@@ -72,11 +105,11 @@ def _schedule_post_ingestion_jobs(session, task_context) -> None:
         return
 
     existing_summary = (
-        session.query(Event)
+        session.query(Event.id)
         .filter(
             and_(
                 Event.data["event_type"].astext == "document_summary",
-                Event.data["document_id"].astext == document_id,
+                summary_document_id_expression() == document_id,
             )
         )
         .first()
@@ -119,26 +152,34 @@ def _auto_classify_from_summary(session, task_context) -> None:
 
     classifier = get_classification_service()
 
-    for document_id, summary_payload in summaries.items():
-        if not document_id or not isinstance(summary_payload, dict):
-            continue
-
-        exists = (
-            session.query(DocumentClassificationHistory)
-            .filter(DocumentClassificationHistory.document_id == document_id)
-            .first()
-        )
-        if exists:
-            continue
+    pending_ids = [
+        document_id
+        for document_id, summary_payload in summaries.items()
+        if document_id and isinstance(summary_payload, dict)
+    ]
+    if not pending_ids:
+        return
+    already_classified = {
+        document_id
+        for (document_id,) in session.query(DocumentClassificationHistory.document_id)
+        .filter(DocumentClassificationHistory.document_id.in_(pending_ids))
+        .distinct()
+    }
 
-        text_input = _render_summary_for_classification(summary_payload)
-        if not text_input:
+    pending: List[tuple[str, str]] = []
+    for document_id in pending_ids:
+        if document_id in already_classified:
             continue
+        text_input = _render_summary_for_classification(summaries[document_id])
+        if text_input:
+            pending.append((document_id, text_input))
+    if not pending:
+        return
 
-        try:
-            result = classifier.classify(text=text_input, candidate_labels=candidate_labels)
-        except Exception as exc:
-            logger.warning("Automatic classification failed for document %s: %s", document_id, exc)
+    results = _classify_pending(classifier, pending, candidate_labels)
+    for (document_id, _), result in zip(pending, results):
+        if isinstance(result, BaseException):
+            logger.warning("Automatic classification failed for document %s: %s", document_id, result)
             continue
 
         record_classification_result(
@@ -152,27 +193,50 @@ def _auto_classify_from_summary(session, task_context) -> None:
         logger.info("Stored automatic classification for document %s label=%s", document_id, result.label)
 
 
-def _render_summary_for_classification(summary_payload: Dict[str, Any]) -> Optional[str]:
-    segments: List[str] = []
+def _classify_pending(classifier, pending: List[tuple[str, str]], candidate_labels: List[str]) -> List[Any]:
+    """Classify pending documents as one concurrent batch, aligned with ``pending``.
 
-    summary = summary_payload.get("summary")
-    if isinstance(summary, str) and summary.strip():
-        segments.append(summary.strip())
+    Per-document failures come back as exceptions. If the batch itself cannot
+    run (e.g. the async client fails to start), fall back to synchronous calls
+    spread over a small thread pool.
+    """
+    texts = [text_input for _, text_input in pending]
+    try:
+        return classifier.classify_many(texts, candidate_labels, return_exceptions=True)
+    except Exception:
+        logger.exception("Batch classification failed; classifying %d documents individually", len(texts))
 
-    bullet_points = summary_payload.get("bullet_points")
-    if isinstance(bullet_points, list):
-        bullets = [str(item).strip() for item in bullet_points if str(item).strip()]
-        if bullets:
-            segments.append("Highlights:\n" + "\n".join(f"- {line}" for line in bullets))
+    def classify_one(text_input: str) -> Any:
+        try:
+            return classifier.classify(text=text_input, candidate_labels=candidate_labels)
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=min(MAX_INFLIGHT, len(texts))) as pool:
+        return list(pool.map(classify_one, texts))
+
+
+def _render_bullets(header: str, items: Any) -> Optional[str]:
+    if not isinstance(items, list):
+        return None
+    lines = [line for line in (str(item).strip() for item in items) if line]
+    return header + "\n- " + "\n- ".join(lines) if lines else None
 
-    next_steps = summary_payload.get("next_steps")
-    if isinstance(next_steps, list):
-        steps = [str(item).strip() for item in next_steps if str(item).strip()]
-        if steps:
-            segments.append("Next steps:\n" + "\n".join(f"- {line}" for line in steps))
 
-    combined = "\n\n".join(segment for segment in segments if segment)
-    return combined or None
+def _render_summary_for_classification(summary_payload: Dict[str, Any]) -> Optional[str]:
+    summary = summary_payload.get("summary")
+    summary = summary.strip() if isinstance(summary, str) else ""
+    bullet_points = summary_payload.get("bullet_points")
+    next_steps = summary_payload.get("next_steps")
+    if not bullet_points and not next_steps:
+        return summary or None
+
+    segments = [
+        summary,
+        _render_bullets("Highlights:", bullet_points),
+        _render_bullets("Next steps:", next_steps),
+    ]
+    return "\n\n".join(segment for segment in segments if segment) or None
 
 
 event_schema_adapter = TypeAdapter(EventSchema)
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any, Dict
 
 import requests
+from requests.adapters import HTTPAdapter
 
 """
 Event Sender Module
@@ -25,6 +26,14 @@ API_KEY_HEADER = os.getenv("DOCULENS_API_KEY_HEADER", "X-API-Key")
 BASE_URL = f"{DEFAULT_BASE_URL.rstrip('/')}/events"
 EVENTS_DIR = Path(__file__).parent.parent / "requests/events"
 
+# One keep-alive session so sending several files reuses the same connection.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_maxsize=32))
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=32))
+_SESSION.headers.update({"Content-Type": "application/json"})
+if API_KEY_VALUE:
+    _SESSION.headers[API_KEY_HEADER] = API_KEY_VALUE
+
 
 def load_event(event_file: str):
     """Load event data from JSON file.
@@ -35,8 +44,7 @@ def load_event(event_file: str):
     Returns:
         Dict containing the event data
     """
-    with open(EVENTS_DIR / event_file, "r") as f:
-        return json.load(f)
+    return json.loads((EVENTS_DIR / event_file).read_bytes())
 
 
 def send_event(event_file: str) -> Dict[str, Any]:
@@ -46,11 +54,7 @@ def send_event(event_file: str) -> Dict[str, Any]:
         event_file: Name of the JSON file to send
     """
     payload = load_event(event_file)
-    headers = {"Content-Type": "application/json"}
-    if API_KEY_VALUE:
-        headers[API_KEY_HEADER] = API_KEY_VALUE
-
-    response = requests.post(BASE_URL, json=payload, headers=headers)
+    response = _SESSION.post(BASE_URL, json=payload)
 
     print(f"Testing {event_file}:")
     print(f"Status Code: {response.status_code}")
@@ -71,12 +75,13 @@ def send_event(event_file: str) -> Dict[str, Any]:
 if __name__ == "__main__":
     import argparse
 
-    parser = argparse.ArgumentParser(description="Send an event JSON file to the API.")
+    parser = argparse.ArgumentParser(description="Send event JSON files to the API.")
     parser.add_argument(
-        "event_file",
-        nargs="?",
-        default="your-event.json",
-        help="Name of the JSON file inside requests/events/",
+        "event_files",
+        nargs="*",
+        default=["your-event.json"],
+        help="Names of JSON files inside requests/events/",
     )
     args = parser.parse_args()
-    send_event(event_file=args.event_file)
+    for event_file in args.event_files:
+        send_event(event_file=event_file)
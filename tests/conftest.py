@@ -9,14 +9,17 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 # Provide fallback API keys so Pydantic settings don't fail in CI.
-os.environ.setdefault("OPENAI_API_KEY", "ci-test-key")
-os.environ.setdefault("ANTHROPIC_API_KEY", "ci-test-key")
-os.environ.setdefault("OPEN_ROUTER_API_KEY", "ci-test-key")
-os.environ.setdefault("DATABASE_HOST", "localhost")
-os.environ.setdefault("DATABASE_PORT", "5432")
-os.environ.setdefault("DATABASE_NAME", "doculens")
-os.environ.setdefault("DATABASE_USER", "postgres")
-os.environ.setdefault("DATABASE_PASSWORD", "ci-password")
+ENV_DEFAULTS = {
+    "OPENAI_API_KEY": "ci-test-key",
+    "ANTHROPIC_API_KEY": "ci-test-key",
+    "OPEN_ROUTER_API_KEY": "ci-test-key",
+    "DATABASE_HOST": "localhost",
+    "DATABASE_PORT": "5432",
+    "DATABASE_NAME": "doculens",
+    "DATABASE_USER": "postgres",
+    "DATABASE_PASSWORD": "ci-password",
+}
+os.environ.update({key: ENV_DEFAULTS[key] for key in ENV_DEFAULTS.keys() - os.environ.keys()})
 
 from config.settings import get_settings
 
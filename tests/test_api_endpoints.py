@@ -1,8 +1,10 @@
+import asyncio
 import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
@@ -12,11 +14,33 @@ from app.main import app
 from app.config.settings import get_settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
+    # Not entered as a context manager: tests must not run the startup hook,
+    # which initializes the database and vector store.
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def reset_dependency_overrides():
+    """Keep overrides from one test out of the shared client used by the next."""
+    yield
+    app.dependency_overrides.clear()
+
+
+def _gather_requests(*requests):
+    """Send ``(method, url, kwargs)`` requests concurrently against the ASGI app."""
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            return await asyncio.gather(
+                *(async_client.request(method, url, **kwargs) for method, url, kwargs in requests)
+            )
+
+    return asyncio.run(run())
+
+
 def test_get_runtime_config_reflects_settings(monkeypatch, client):
     monkeypatch.setenv("DOCULENS_SUMMARY_CHUNK_LIMIT", "15")
     monkeypatch.setenv("DOCULENS_QA_TOP_K", "7")
@@ -87,6 +111,41 @@ def test_upload_document_persists_file_and_dispatches(monkeypatch, tmp_path, cli
         app.dependency_overrides.pop(db_session, None)
 
 
+def test_concurrent_uploads_are_each_accepted(monkeypatch, tmp_path):
+    stored_filenames = []
+
+    def fake_store_event(session, payload):
+        stored_filenames.append(payload["filename"])
+        return type("DummyEvent", (), {"id": uuid4()})(), "task-123"
+
+    def fake_session():
+        yield None
+
+    monkeypatch.setattr(endpoint_module, "_ensure_ingestion_dir", lambda: tmp_path)
+    monkeypatch.setattr(endpoint_module, "_store_event_and_dispatch", fake_store_event)
+    app.dependency_overrides[db_session] = fake_session
+
+    try:
+        responses = _gather_requests(
+            *(
+                (
+                    "POST",
+                    "/events/documents/upload",
+                    {"files": {"file": (f"doc-{index}.txt", b"content", "text/plain")}},
+                )
+                for index in range(5)
+            )
+        )
+    finally:
+        app.dependency_overrides.pop(db_session, None)
+
+    assert [response.status_code for response in responses] == [202] * 5
+    assert [response.json()["original_filename"] for response in responses] == [
+        f"doc-{index}.txt" for index in range(5)
+    ]
+    assert len(set(stored_filenames)) == 5
+
+
 def test_upload_document_rejects_invalid_metadata(monkeypatch, tmp_path, client):
     called = False
 
@@ -112,3 +171,65 @@ def test_upload_document_rejects_invalid_metadata(monkeypatch, tmp_path, client)
         assert called is False
     finally:
         app.dependency_overrides.pop(db_session, None)
+
+
+def test_classify_async_queues_task_and_reports_result(monkeypatch, client):
+    sent: Dict[str, Any] = {}
+
+    class FakeAsyncResult:
+        state = "SUCCESS"
+        result = {
+            "document_id": "doc-1",
+            "predicted_label": "invoice",
+            "confidence": 0.9,
+            "scores": [{"label": "invoice", "score": 0.9}],
+            "candidate_labels": ["invoice", "contract"],
+            "used_text_preview": "Invoice #42",
+            "reasoning": None,
+        }
+
+    class FakeCelery:
+        def send_task(self, name, args):
+            sent.update(name=name, args=args)
+            return type("Result", (), {"id": "task-9"})()
+
+        def AsyncResult(self, task_id):
+            sent["polled"] = task_id
+            return FakeAsyncResult()
+
+    def fake_session():
+        yield None
+
+    monkeypatch.setattr(endpoint_module, "celery_app", FakeCelery())
+    app.dependency_overrides[db_session] = fake_session
+    try:
+        queued = client.post(
+            "/events/documents/doc-1/classify/async",
+            json={"text_override": "Invoice #42", "candidate_labels": ["invoice", "contract"]},
+        )
+        status = client.get("/events/classifications/task-9")
+    finally:
+        app.dependency_overrides.pop(db_session, None)
+
+    assert queued.status_code == 202
+    assert queued.json() == {"task_id": "task-9", "status": "PENDING", "result": None, "error": None}
+    assert sent["name"] == "classify_document"
+    assert sent["args"] == ["doc-1", "Invoice #42", ["invoice", "contract"]]
+    assert sent["polled"] == "task-9"
+    assert status.json()["result"]["predicted_label"] == "invoice"
+
+
+def test_classification_status_hides_other_task_results(monkeypatch, client):
+    class FakeAsyncResult:
+        state = "SUCCESS"
+        result = None
+
+    class FakeCelery:
+        def AsyncResult(self, task_id):
+            return FakeAsyncResult()
+
+    monkeypatch.setattr(endpoint_module, "celery_app", FakeCelery())
+
+    response = client.get("/events/classifications/event-task-1")
+
+    assert response.status_code == 404
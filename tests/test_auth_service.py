@@ -0,0 +1,120 @@
+import asyncio
+import uuid
+
+import pytest
+from fastapi import HTTPException, Request
+
+from app.config.settings import get_settings
+from app.database.user import User
+from app.services import auth_service
+from app.services.auth_service import AuthService
+
+
+def test_new_hashes_use_argon2():
+    hashed = AuthService.hash_password("s3cret")
+
+    assert hashed.startswith("$argon2id$")
+    assert AuthService.verify_password("s3cret", hashed)
+
+
+def test_verify_password_cached_skips_kdf_on_repeat(monkeypatch):
+    auth_service._verify_cache.clear()
+    hashed = AuthService.hash_password("s3cret")
+    calls = []
+    original = auth_service.pwd_context.verify_and_update
+
+    def counting_verify(password, stored):
+        calls.append(password)
+        return original(password, stored)
+
+    monkeypatch.setattr(auth_service.pwd_context, "verify_and_update", counting_verify)
+
+    assert AuthService.verify_password_cached("s3cret", hashed) == (True, None)
+    assert AuthService.verify_password_cached("s3cret", hashed) == (True, None)
+    assert AuthService.verify_password_cached("wrong", hashed) == (False, None)
+    assert AuthService.verify_password_cached("wrong", hashed) == (False, None)
+    assert calls == ["s3cret", "wrong", "wrong"]
+
+
+
+def _user():
+    return User(
+        id=uuid.UUID(int=1),
+        email="analyst@example.com",
+        full_name="Ana Lyst",
+        hashed_password="unused",
+        persona="analyst",
+        role="analyst",
+        access_level="standard",
+        is_active=True,
+    )
+
+
+class _Session:
+    def __init__(self):
+        self.queries = 0
+
+    def query(self, model):
+        self.queries += 1
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def first(self):
+        return _user()
+
+    def merge(self, instance, load=True):
+        assert load is False
+        return instance
+
+
+def test_access_token_round_trip_uses_refreshed_settings(monkeypatch):
+    monkeypatch.setattr(auth_service, "_auth_settings", None)
+    monkeypatch.setenv("DOCULENS_AUTH_SECRET", "first-secret")
+    token = auth_service.create_access_token(user=_user())
+
+    assert auth_service.decode_access_token(token, _Session()).id == uuid.UUID(int=1)
+
+    monkeypatch.setenv("DOCULENS_AUTH_SECRET", "rotated-secret")
+    get_settings.cache_clear()
+    auth_service.refresh_auth_settings()
+
+    with pytest.raises(HTTPException) as excinfo:
+        auth_service.decode_access_token(token, _Session())
+    assert excinfo.value.status_code == 401
+
+
+def test_decode_access_token_reuses_cached_user(monkeypatch):
+    monkeypatch.setattr(auth_service, "_auth_settings", None)
+    auth_service._user_cache.clear()
+    token = auth_service.create_access_token(user=_user())
+    session = _Session()
+
+    first = auth_service.decode_access_token(token, session)
+    second = auth_service.decode_access_token(token, session)
+
+    assert session.queries == 1
+    assert second.email == first.email == "analyst@example.com"
+
+    auth_service.evict_cached_user(first.id)
+    auth_service.decode_access_token(token, session)
+    assert session.queries == 2
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("Bearer abc.def", "abc.def"),
+        ("bearer abc.def", "abc.def"),
+        ("Basic dXNlcjpwYXNz", None),
+        ("Bearer ", None),
+        (None, None),
+    ],
+)
+def test_bearer_scheme_returns_raw_token(header, expected):
+    headers = [(b"authorization", header.encode())] if header is not None else []
+    request = Request({"type": "http", "headers": headers})
+
+    assert asyncio.run(auth_service.bearer_scheme(request)) == expected
+
@@ -0,0 +1,61 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import classification_service
+from app.services.classification_service import OpenAIClassificationService, _strip_code_fence
+
+
+@pytest.mark.parametrize(
+    "payload, expected",
+    [
+        ('{"label": "invoice"}', '{"label": "invoice"}'),
+        ('```json\n{"label": "invoice"}\n```', '{"label": "invoice"}'),
+        ('  ```\n{"label": "invoice",\n "confidence": 0.9}\n```  ', '{"label": "invoice",\n "confidence": 0.9}'),
+        ('```json\n{"label": "invoice"}', '{"label": "invoice"}'),
+        ("```json\n```", ""),
+    ],
+)
+def test_strip_code_fence(payload, expected):
+    assert _strip_code_fence(payload) == expected
+
+
+class _FakeResponses:
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, *, model, input, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        label = "invoice" if "invoice" in input.rsplit("Document:", 1)[1] else "contract"
+        return SimpleNamespace(output_text=json.dumps({"label": label, "confidence": 0.9, "reason": "match"}))
+
+
+def test_classify_many_keeps_order_and_bounds_concurrency(monkeypatch):
+    responses = _FakeResponses()
+
+    class _FakeAsyncOpenAI:
+        async def __aenter__(self):
+            return SimpleNamespace(responses=responses)
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(classification_service, "AsyncOpenAI", _FakeAsyncOpenAI)
+    service = OpenAIClassificationService()
+
+    results = service.classify_many(
+        ["an invoice", "a contract", "another invoice", "   "],
+        ["invoice", "contract"],
+        max_inflight=2,
+        return_exceptions=True,
+    )
+
+    assert [result.label for result in results[:3]] == ["invoice", "contract", "invoice"]
+    assert isinstance(results[3], ValueError)
+    assert responses.peak == 2
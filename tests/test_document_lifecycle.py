@@ -0,0 +1,63 @@
+from app.database.event import Event
+from app.doc_utils import search as search_module
+from app.services import document_lifecycle
+from app.services.document_lifecycle import _apply_status_to_upload_event
+from app.services.semantic_cache import get_qa_answer_cache
+
+
+class _Session:
+    def __init__(self):
+        self.added = []
+        self.commits = 0
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_restore_clears_archive_flags_in_place():
+    document = {"id": "doc-1", "archived": True, "metadata": {"archived_at": "earlier"}}
+    event = Event(
+        data={"metadata": {"archived": True}},
+        task_context={"metadata": {"document": document, "archived": True}},
+    )
+
+    _apply_status_to_upload_event(
+        event,
+        status="processing",
+        timestamp="now",
+        clear_keys={"archived", "archived_at"},
+        flags={"restored_at": "now"},
+    )
+
+    assert event.task_context["metadata"]["document"] is document
+    assert document == {
+        "id": "doc-1",
+        "status": "processing",
+        "processing_at": "now",
+        "restored_at": "now",
+        "metadata": {"status": "processing", "processing_at": "now", "restored_at": "now"},
+    }
+    assert event.task_context["metadata"]["status"] == "processing"
+    assert "archived" not in event.task_context["metadata"]
+    assert event.data == {"metadata": {"status": "processing", "processing_at": "now", "restored_at": "now"}}
+
+
+def test_lifecycle_transition_drops_cached_search_results_and_answers(monkeypatch):
+    upload_event = Event(data={}, task_context={"metadata": {"document": {"id": "doc-1"}}})
+    monkeypatch.setattr(document_lifecycle, "get_upload_event_for_document", lambda session, document_id: upload_event)
+    key = ("total", 3, search_module._filter_key(None))
+    search_module._cache_put(key, [{"id": "chunk-1", "metadata": {"document_id": "doc-1"}}])
+    get_qa_answer_cache.cache_clear()
+    answers = get_qa_answer_cache()
+    answers.put([1.0, 0.0], {"answer": "cites doc-1"})
+    session = _Session()
+
+    document_lifecycle.archive_document(session, "doc-1")
+
+    assert session.commits == 1
+    assert search_module._cache_get(key) is None
+    assert answers.get([1.0, 0.0]) is None
+    get_qa_answer_cache.cache_clear()
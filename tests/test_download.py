@@ -0,0 +1,81 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.doc_utils import download as download_module
+from app.doc_utils.download import download_file
+
+PAYLOAD = bytes(range(256)) * 40  # 10 KiB
+
+
+class _Handler(BaseHTTPRequestHandler):
+    supports_ranges = True
+    head_status = 200
+    range_requests = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        if self.head_status != 200:
+            self.send_response(self.head_status)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        if self.supports_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self):
+        header = self.headers.get("Range")
+        if header and self.supports_ranges:
+            type(self).range_requests += 1
+            start, end = (int(part) for part in header.removeprefix("bytes=").split("-"))
+            body = PAYLOAD[start : end + 1]
+            self.send_response(206)
+        else:
+            body = PAYLOAD
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server_url():
+    _Handler.supports_ranges = True
+    _Handler.head_status = 200
+    _Handler.range_requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/doc.pdf"
+    server.shutdown()
+
+
+def test_download_file_fetches_ranges_in_parallel(server_url, tmp_path):
+    target = download_file(server_url, tmp_path / "doc.pdf", chunk_size=1024, max_workers=4)
+
+    assert target.read_bytes() == PAYLOAD
+    assert _Handler.range_requests == 10
+
+
+def test_download_file_streams_when_ranges_unsupported(server_url, tmp_path):
+    _Handler.supports_ranges = False
+
+    target = download_file(server_url, tmp_path / "doc.pdf", chunk_size=1024)
+
+    assert target.read_bytes() == PAYLOAD
+    assert _Handler.range_requests == 0
+
+
+def test_download_file_streams_when_head_keeps_failing(server_url, tmp_path, monkeypatch):
+    _Handler.head_status = 503
+    monkeypatch.setattr(download_module.time, "sleep", lambda seconds: None)
+
+    target = download_file(server_url, tmp_path / "doc.pdf", chunk_size=1024)
+
+    assert target.read_bytes() == PAYLOAD
+    assert _Handler.range_requests == 0
@@ -0,0 +1,64 @@
+import uuid
+from types import SimpleNamespace
+
+from app.services.label_service import LabelService, clear_candidate_label_cache
+
+
+def _label(name, label_type="label", parent=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        label_name=name,
+        label_type=label_type,
+        description=None,
+        workspace_id=None,
+        parent_label_id=parent.id if parent else None,
+    )
+
+
+def test_get_label_tree_groups_children_under_domains(monkeypatch):
+    finance = _label("Finance", "domain")
+    legal = _label("Legal", "domain")
+    missing_parent = _label("Missing", "domain")
+    rows = [
+        _label("Contract", parent=legal),
+        finance,
+        _label("Invoice", parent=finance),
+        legal,
+        _label("Memo", parent=missing_parent),
+        _label("Receipt", parent=finance),
+    ]
+    service = LabelService(session=None)
+    monkeypatch.setattr(service, "list_flat_labels", lambda: rows)
+
+    tree = service.get_label_tree()
+
+    assert [(node["name"], [child["name"] for child in node["children"]]) for node in tree] == [
+        ("Finance", ["Invoice", "Receipt"]),
+        ("Legal", ["Contract"]),
+        ("Ungrouped", ["Memo"]),
+    ]
+
+
+class _CountingSession:
+    def __init__(self, names):
+        self.names = names
+        self.executions = 0
+
+    def execute(self, query):
+        self.executions += 1
+        return [(name,) for name in self.names]
+
+
+def test_get_candidate_labels_is_cached_until_cleared():
+    clear_candidate_label_cache()
+    session = _CountingSession(["Invoice", "Receipt"])
+    service = LabelService(session=session)
+
+    assert service.get_candidate_labels() == ["Invoice", "Receipt"]
+    session.names = ["Contract"]
+    assert service.get_candidate_labels() == ["Invoice", "Receipt"]
+    assert session.executions == 1
+
+    clear_candidate_label_cache()
+    assert service.get_candidate_labels() == ["Contract"]
+    assert session.executions == 2
@@ -0,0 +1,24 @@
+import frontmatter
+
+from app.services.prompt_loader import PromptManager
+
+
+def test_get_prompt_reads_each_template_once(monkeypatch):
+    PromptManager._load_template.cache_clear()
+    loads = []
+    original_load = frontmatter.load
+
+    def counting_load(handle):
+        loads.append(handle.name)
+        return original_load(handle)
+
+    monkeypatch.setattr(frontmatter, "load", counting_load)
+
+    first = PromptManager.get_prompt("document_summary")
+    second = PromptManager.get_prompt("document_summary")
+    info = PromptManager.get_template_info("document_summary")
+
+    assert first == second
+    assert info["name"] == "document_summary"
+    assert len(loads) == 1
+    PromptManager._load_template.cache_clear()
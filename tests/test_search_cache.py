@@ -0,0 +1,70 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from app.doc_utils import search as search_module
+
+
+class FakeVectorStore:
+    calls: List[Dict[str, Any]] = []
+
+    def semantic_search(self, query, limit, metadata_filter=None, return_dataframe=True):
+        FakeVectorStore.calls.append({"query": query, "limit": limit, "metadata_filter": metadata_filter})
+        return [("id-1", {"document_id": "doc-1"}, "alpha", None, 0.1)]
+
+    async def semantic_search_iter(self, query, limit, metadata_filter=None):
+        for row in self.semantic_search(query, limit, metadata_filter=metadata_filter):
+            yield row
+
+
+@pytest.fixture(autouse=True)
+def fake_store(monkeypatch):
+    FakeVectorStore.calls = []
+    search_module.clear_search_cache()
+    monkeypatch.setattr(search_module, "VectorStore", FakeVectorStore)
+    yield
+    search_module.clear_search_cache()
+
+
+def test_repeated_search_is_served_from_cache():
+    first = search_module.semantic_search_docling("total", limit=3, metadata_filter={"a": 1, "b": 2})
+    first[0]["metadata"]["mutated"] = True
+    second = search_module.semantic_search_docling("total", limit=3, metadata_filter={"b": 2, "a": 1})
+
+    assert len(FakeVectorStore.calls) == 1
+    assert second == [
+        {"id": "id-1", "metadata": {"document_id": "doc-1"}, "contents": "alpha", "distance": 0.1}
+    ]
+
+
+def test_cache_distinguishes_limits_and_can_be_disabled(monkeypatch):
+    search_module.semantic_search_docling("total", limit=3)
+    search_module.semantic_search_docling("total", limit=4)
+    assert len(FakeVectorStore.calls) == 2
+
+    monkeypatch.setenv("DOCULENS_SEARCH_CACHE_SIZE", "0")
+    from app.config.settings import get_settings
+
+    get_settings.cache_clear()
+    search_module.semantic_search_docling("total", limit=3)
+    assert len(FakeVectorStore.calls) == 3
+
+
+def test_filter_key_is_canonical_for_nested_filters():
+    left = search_module._filter_key({"a": {"y": 1, "x": 2}, "b": [1, 2]})
+    right = search_module._filter_key({"b": [1, 2], "a": {"x": 2, "y": 1}})
+
+    assert left == right
+    assert search_module._filter_key(None) == search_module._filter_key({})
+
+
+def test_streaming_search_yields_normalized_rows_without_caching():
+    async def collect():
+        return [row async for row in search_module.iter_semantic_search_docling("total", limit=3)]
+
+    assert asyncio.run(collect()) == [
+        {"id": "id-1", "metadata": {"document_id": "doc-1"}, "contents": "alpha", "distance": 0.1}
+    ]
+    asyncio.run(collect())
+    assert len(FakeVectorStore.calls) == 2
@@ -0,0 +1,34 @@
+from app.services.semantic_cache import SemanticCache, get_qa_answer_cache
+
+
+def test_semantic_cache_matches_similar_vectors_within_namespace():
+    cache = SemanticCache(max_entries=4, threshold=0.9, ttl_seconds=60)
+    cache.put([1.0, 0.0, 0.0], {"answer": "a"}, namespace="top5")
+
+    assert cache.get([0.99, 0.05, 0.0], namespace="top5") == {"answer": "a"}
+    assert cache.get([0.0, 1.0, 0.0], namespace="top5") is None
+    assert cache.get([1.0, 0.0, 0.0], namespace="top10") is None
+
+
+def test_semantic_cache_evicts_least_recently_used_and_expired():
+    cache = SemanticCache(max_entries=2, threshold=0.99, ttl_seconds=60)
+    cache.put([1.0, 0.0], "x")
+    cache.put([0.0, 1.0], "y")
+    assert cache.get([1.0, 0.0]) == "x"
+    cache.put([-1.0, 0.0], "z")
+
+    assert cache.get([0.0, 1.0]) is None
+    assert cache.get([1.0, 0.0]) == "x"
+
+    expired = SemanticCache(max_entries=2, threshold=0.9, ttl_seconds=0)
+    expired.put([1.0, 0.0], "x")
+    assert expired.get([1.0, 0.0]) is None
+
+
+def test_qa_answer_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("DOCULENS_QA_CACHE_SIZE", "0")
+    get_qa_answer_cache.cache_clear()
+    try:
+        assert get_qa_answer_cache() is None
+    finally:
+        get_qa_answer_cache.cache_clear()
@@ -0,0 +1,72 @@
+import asyncio
+
+from timescale_vector import client as timescale_client
+
+from app.services.vector_store import VectorStore
+
+
+class _FakeTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeConnection:
+    def __init__(self, loop):
+        self.loop = loop
+
+    def transaction(self):
+        return _FakeTransaction()
+
+    async def cursor(self, query, *params, prefetch=None):
+        # asyncpg connections fail when used from a loop other than their own.
+        assert asyncio.get_running_loop() is self.loop, "pool used from a foreign event loop"
+        yield ("id-1", {"document_id": "doc-1"}, "alpha", None, 0.1)
+
+
+class _FakeAcquire:
+    def __init__(self, loop):
+        self.connection = _FakeConnection(loop)
+
+    async def __aenter__(self):
+        return self.connection
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakePool:
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+
+    def acquire(self):
+        return _FakeAcquire(self.loop)
+
+
+def test_async_client_is_not_shared_across_event_loops(monkeypatch):
+    pools = []
+
+    async def fake_create_pool(**kwargs):
+        pools.append(_FakePool())
+        return pools[-1]
+
+    async def fake_max_connections(self):
+        return 4
+
+    monkeypatch.setattr(timescale_client.asyncpg, "create_pool", fake_create_pool)
+    monkeypatch.setattr(timescale_client.Async, "_default_max_db_connections", fake_max_connections)
+    monkeypatch.setattr(VectorStore, "get_embedding", lambda self, text: [0.1, 0.2, 0.3])
+
+    async def search_twice():
+        first = [row async for row in VectorStore().semantic_search_iter("total", limit=3)]
+        second = [row async for row in VectorStore().semantic_search_iter("total", limit=3)]
+        return first, second
+
+    for _ in range(2):
+        first, second = asyncio.run(search_twice())
+        assert first == second
+
+    assert len(pools) == 2
+    assert pools[0].loop is not pools[1].loop